@@ -13,6 +13,9 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from main import Article, Source, Base
+from article_scores import backfill_article_scores
+from ingest_stats import rebuild_ingest_stats
+from url_canonical import url_hash
 
 # Database setup
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./news_screener.db")
@@ -163,7 +166,7 @@ def add_sample_articles():
             article_url = f"https://example.com/haryana/{article_data['category']}/{i+1}"
             
             # Check if article already exists
-            existing = db.query(Article).filter(Article.url == article_url).first()
+            existing = db.query(Article).filter(Article.url_hash == url_hash(article_url)).first()
             if existing:
                 print(f"  - Already exists: {article_data['title'][:50]}...")
                 continue
@@ -187,6 +190,9 @@ def add_sample_articles():
         
         db.commit()
         print(f"\n✅ Successfully added {added} sample articles")
+        print(f"✅ Scored {backfill_article_scores()} articles for /haryana/articles")
+        rebuild_ingest_stats(db)
+        db.commit()
         print(f"\n📊 Total articles in database: {db.query(Article).count()}")
         
         print("\n" + "="*70)
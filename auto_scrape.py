@@ -39,12 +39,14 @@ def get_stats(db):
         'last_24h': recent_count
     }
 
-def auto_scrape(verbose=True):
+def auto_scrape(verbose=True, progress=None):
     """
     Automatically scrape news from all active sources
     
     Args:
         verbose: Print detailed output (default True)
+        progress: Optional callback, called after each source with a dict
+            (source_id, source, articles_found, new_articles, not_modified, error)
     
     Returns:
         dict: Scraping results
@@ -61,6 +63,7 @@ def auto_scrape(verbose=True):
         'sources_scraped': 0,
         'articles_found': 0,
         'new_articles': 0,
+        'not_modified': 0,
         'errors': []
     }
     
@@ -75,7 +78,7 @@ def auto_scrape(verbose=True):
             print()
         
         # Get active sources
-        sources = db.query(Source).filter(Source.is_active == True).all()
+        sources = db.query(Source).filter(Source.is_active == True, Source.rss_feed != None, Source.rss_feed != '').all()
         
         if not sources:
             if verbose:
@@ -87,36 +90,50 @@ def auto_scrape(verbose=True):
             print(f"🔍 Scraping {len(sources)} news sources...")
             print()
         
-        # Scrape each source
-        for source in sources:
+        # Feeds download concurrently; each source is parsed and saved as its feed arrives
+        for source, feed_response in scraper.fetch_feeds(sources):
             results['sources_scraped'] += 1
+            source_progress = {'source_id': source.id, 'source': source.name, 'articles_found': 0,
+                               'new_articles': 0, 'not_modified': feed_response.not_modified, 'error': None}
             
             try:
                 if verbose:
                     print(f"   [{results['sources_scraped']}/{len(sources)}] {source.name}...", end=' ')
                 
-                articles = scraper.scrape_rss_feed(source.rss_feed, source.id)
+                if not feed_response.ok:
+                    raise RuntimeError(feed_response.error)
+                articles = scraper.parse_feed(feed_response, source.id)
                 saved_count = scraper.save_articles(articles)
+                # Only reached when the feed parsed and its articles committed; a failure
+                # leaves the old validators so the next run downloads the feed again
+                scraper.record_fetch(db, source, feed_response)
                 
                 results['articles_found'] += len(articles)
                 results['new_articles'] += saved_count
+                results['not_modified'] += feed_response.not_modified
                 
                 if verbose:
-                    if saved_count > 0:
+                    if feed_response.not_modified:
+                        print("✓ unchanged since last run")
+                    elif saved_count > 0:
                         print(f"✅ +{saved_count} new")
                     elif len(articles) > 0:
                         print(f"✓ {len(articles)} checked, none new")
                     else:
                         print("⚠️ no articles")
                 
-                # Small delay between sources
-                time.sleep(1)
+                source_progress['articles_found'] = len(articles)
+                source_progress['new_articles'] = saved_count
                 
             except Exception as e:
                 error_msg = f"Error scraping {source.name}: {str(e)}"
                 results['errors'].append(error_msg)
                 if verbose:
                     print(f"❌ Error: {str(e)}")
+                source_progress['error'] = str(e)
+            
+            if progress:
+                progress(source_progress)
         
         # Get statistics after scraping
         if verbose:
@@ -128,6 +145,7 @@ def auto_scrape(verbose=True):
             print(f"\n✅ Sources scraped: {results['sources_scraped']}")
             print(f"✅ Articles checked: {results['articles_found']}")
             print(f"✅ New articles saved: {results['new_articles']}")
+            print(f"✅ Feeds unchanged (304): {results['not_modified']}")
             print(f"\n📈 Database status:")
             print(f"   • Total articles: {stats_after['total']} (+{stats_after['total'] - stats_before['total']})")
             print(f"   • Haryana-relevant: ~{stats_after['haryana_relevant']}% of recent articles")
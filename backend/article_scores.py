@@ -0,0 +1,112 @@
+"""
+Persisted per-article, per-preset relevance scores
+Scores are computed once at ingest so /haryana/articles can serve them with an
+indexed ORDER BY score query instead of rescoring articles on every request
+"""
+
+import logging
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from main import Article, ArticleScore, ArticleTerm, SessionLocal, bump_ingest_generation
+from haryana_config import analyze_text, is_haryana_relevant, score_all_presets, scoring_fingerprint
+from term_index import posting_mappings
+
+logger = logging.getLogger(__name__)
+
+
+def score_mappings(article_id: int, results: Dict[str, Dict], best_preset: str, relevant: bool,
+                   config_hash: Optional[str] = None) -> List[Dict]:
+    """
+    ArticleScore column dicts for one article, for bulk inserts
+
+    Args:
+        article_id: Article the scores belong to
+        results: calculate_relevance_score result per preset (score_all_presets()["results"])
+        best_preset: Key of the best-scoring preset
+        relevant: Whether the article is Haryana-relevant
+        config_hash: Scoring configuration to stamp (default: scoring_fingerprint())
+    """
+    config_hash = config_hash or scoring_fingerprint()
+    mappings = []
+    for preset_key, result in results.items():
+        matched_keywords = result.get("matched_keywords", [])
+        positive_matches = result.get("positive_matches", [])
+        negative_matches = result.get("negative_matches", [])
+        mappings.append({
+            "article_id": article_id,
+            "preset": preset_key,
+            "score": result.get("score", 0),
+            "sentiment": result.get("sentiment", "neutral"),
+            "is_best": preset_key == best_preset,
+            "is_relevant": relevant,
+            "matched_count": len(matched_keywords),
+            "positive_count": len(positive_matches),
+            "negative_count": len(negative_matches),
+            "matched_keywords": matched_keywords,
+            "positive_matches": positive_matches,
+            "negative_matches": negative_matches,
+            "config_hash": config_hash,
+        })
+    return mappings
+
+
+def delete_article_scores(db: Session, article_ids: List[int]) -> int:
+    """Delete stored scores for the given articles (caller commits)"""
+    if not article_ids:
+        return 0
+    return db.query(ArticleScore).filter(
+        ArticleScore.article_id.in_(article_ids)
+    ).delete(synchronize_session=False)
+
+
+def backfill_article_scores(batch_size: int = 500) -> int:
+    """
+    Score and index articles that have no stored scores yet (e.g. inserted by test-data scripts)
+
+    Returns:
+        Number of articles scored; an error rolls back the current batch and is re-raised
+    """
+    db = SessionLocal()
+    scored = 0
+
+    try:
+        scored_ids = db.query(ArticleScore.article_id).distinct()
+        while True:
+            articles = db.query(Article).filter(
+                ~Article.id.in_(scored_ids)
+            ).order_by(Article.id).limit(batch_size).all()
+            if not articles:
+                break
+
+            score_rows = []
+            postings = []
+            for article in articles:
+                analyzed = analyze_text(f"{article.title} {article.content}")
+                all_scores = score_all_presets(analyzed)
+                score_rows.extend(score_mappings(
+                    article.id, all_scores["results"], all_scores["best_preset"], is_haryana_relevant(analyzed)
+                ))
+                _, _, found_terms = analyzed.scoring_terms
+                postings.extend(posting_mappings(article.id, found_terms))
+            db.bulk_insert_mappings(ArticleScore, score_rows)
+            db.bulk_insert_mappings(ArticleTerm, postings)
+            bump_ingest_generation(db)
+            db.commit()
+            scored += len(articles)
+            logger.info(f"Scored {scored} articles")
+
+    except Exception as e:
+        logger.error(f"Error backfilling article scores: {str(e)}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    return scored
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print(f"✅ Scored {backfill_article_scores()} articles")
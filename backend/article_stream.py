@@ -0,0 +1,189 @@
+"""
+Server-Sent Events stream of newly ingested articles
+save_articles publishes each committed batch to an in-process broker; every
+/stream/articles client holds a subscription with its own bounded queue and
+filters (preset, min score). A client that falls a full queue behind is
+dropped rather than buffered without limit, and is told so with a "dropped"
+event so it can reconnect and reload the list.
+
+Only scrapes running in the API process (scrape jobs, BackgroundTasks) are
+published; a cron auto_scrape.py run in another process is not.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+STREAM_QUEUE_SIZE = int(os.getenv("STREAM_QUEUE_SIZE", "100"))
+KEEPALIVE_SECONDS = 15
+RETRY_MILLISECONDS = 5000
+
+
+def article_event(article, score_rows: Iterable[Dict]) -> Dict:
+    """
+    Broker event for a saved article (built once its batch is committed)
+
+    Args:
+        article: Committed Article (id populated)
+        score_rows: Its ArticleScore column dicts, one per preset
+
+    Returns:
+        Article summary fields plus per-preset scores for subscription filters
+    """
+    return {
+        "article": {
+            "id": article.id,
+            "source_id": article.source_id,
+            "title": article.title,
+            "url": article.url,
+            "published_at": article.published_at.isoformat() if article.published_at else None,
+            "crawled_at": article.crawled_at.isoformat() if article.crawled_at else None,
+            "summary": article.summary,
+        },
+        "scores": {
+            row["preset"]: {
+                "score": row["score"],
+                "sentiment": row["sentiment"],
+                "is_best": row["is_best"],
+                "is_relevant": row["is_relevant"],
+            }
+            for row in score_rows
+        },
+    }
+
+
+class Subscription:
+    """One stream client: filters plus a bounded queue owned by the event loop"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, preset: Optional[str], min_score: float, maxsize: int):
+        self.loop = loop
+        self.preset = preset
+        self.min_score = min_score
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.dropped = False
+
+    def render(self, event: Dict) -> Optional[Dict]:
+        """The client's view of an event, or None if it does not pass the filters"""
+        if self.preset:
+            preset = self.preset
+            score = event["scores"].get(preset)
+        else:
+            # Best-scoring category, as /haryana/articles does without a preset
+            preset, score = next(
+                ((name, values) for name, values in event["scores"].items() if values["is_best"]),
+                (None, None),
+            )
+        if score is None or not score["is_relevant"] or score["score"] < self.min_score:
+            return None
+        return {
+            **event["article"],
+            "relevance_score": score["score"],
+            "sentiment": score["sentiment"],
+            "category": preset,
+        }
+
+    def offer(self, payloads: List[Dict], broker: "ArticleBroker") -> None:
+        """Queue payloads; runs on the subscription's event loop"""
+        if self.dropped:
+            return
+        for payload in payloads:
+            try:
+                self.queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                # Slow consumer: free its backlog and wake it with the end-of-stream marker
+                self.dropped = True
+                broker.unsubscribe(self)
+                while not self.queue.empty():
+                    self.queue.get_nowait()
+                self.queue.put_nowait(None)
+                logger.warning("Dropped slow article stream client")
+                return
+
+
+class ArticleBroker:
+    """Thread-safe fan-out from scraper threads to stream subscriptions"""
+
+    def __init__(self, queue_size: int = STREAM_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscriptions = set()
+        self.published = 0
+        self.dropped = 0
+
+    def subscribe(self, preset: Optional[str] = None, min_score: float = 0) -> Subscription:
+        """Register a client; must be called from the event loop that will consume it"""
+        subscription = Subscription(asyncio.get_running_loop(), preset, min_score, self.queue_size)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.discard(subscription)
+                if subscription.dropped:
+                    self.dropped += 1
+
+    def has_subscribers(self) -> bool:
+        return bool(self._subscriptions)
+
+    def publish(self, events: List[Dict]) -> None:
+        """Fan events out to matching subscriptions; safe to call from any thread"""
+        if not events:
+            return
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+            self.published += len(events)
+        for subscription in subscriptions:
+            payloads = [payload for payload in map(subscription.render, events) if payload is not None]
+            if not payloads:
+                continue
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, payloads, self)
+            except RuntimeError:
+                # Event loop closed (server shutting down)
+                self.unsubscribe(subscription)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "subscribers": len(self._subscriptions),
+                "published": self.published,
+                "dropped": self.dropped,
+                "queue_size": self.queue_size,
+            }
+
+
+article_broker = ArticleBroker()
+
+
+def format_event(event: str, data: Dict, event_id: Optional[int] = None) -> str:
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {json.dumps(data)}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def stream_events(subscription: Subscription, broker: ArticleBroker = article_broker):
+    """SSE body for a subscription; unsubscribes when the client goes away"""
+    try:
+        yield f"retry: {RETRY_MILLISECONDS}\n\n"
+        while True:
+            try:
+                payload = await asyncio.wait_for(subscription.queue.get(), KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                # Comment line keeps proxies from closing an idle connection
+                yield ": keepalive\n\n"
+                continue
+            if payload is None:
+                yield format_event("dropped", {"reason": "Client fell behind; reconnect and reload the list"})
+                return
+            yield format_event("article", payload, event_id=payload["id"])
+    finally:
+        broker.unsubscribe(subscription)
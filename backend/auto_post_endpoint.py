@@ -13,6 +13,7 @@ import logging
 from main import get_db, Article
 from twitter_service import twitter_service
 from haryana_config import calculate_relevance_score, is_haryana_relevant, HARYANA_FILTER_PRESETS
+from term_index import preset_candidates
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +21,7 @@ router = APIRouter()
 
 
 @router.post("/haryana/auto-post")
-async def auto_post_to_twitter(
+def auto_post_to_twitter(
     filter_preset: str = "infrastructure",
     num_posts: int = 3,
     min_score: int = 50,
@@ -44,9 +45,13 @@ async def auto_post_to_twitter(
     if filter_preset not in HARYANA_FILTER_PRESETS:
         raise HTTPException(status_code=400, detail=f"Invalid filter preset: {filter_preset}")
     
-    # Get articles from last 24 hours
+    # Get articles from last 24 hours that match at least one preset keyword;
+    # articles without a keyword match can never score positive for the preset
     yesterday = datetime.utcnow() - timedelta(days=1)
-    articles = db.query(Article).filter(Article.published_at >= yesterday).all()
+    articles = db.query(Article).filter(
+        Article.published_at >= yesterday,
+        Article.id.in_(preset_candidates(db, filter_preset))
+    ).all()
     
     scored_articles = []
     for article in articles:
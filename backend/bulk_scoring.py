@@ -0,0 +1,331 @@
+"""
+Vectorized bulk scoring engine
+Builds a sparse article x term incidence matrix from the preset vocabularies and
+scores every preset for a whole batch of articles with sparse matrix products.
+Produces exactly the same scores as haryana_config.calculate_relevance_score and
+is meant for backfills after tuning SENTIMENT_WEIGHTS or preset keyword lists.
+"""
+
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+from scipy import sparse
+
+import haryana_config
+from haryana_config import (
+    HARYANA_FILTER_PRESETS,
+    VIOLENT_CONTENT_WINDOW,
+    VIOLENT_KEYWORDS,
+    KeywordMatcher,
+)
+
+logger = logging.getLogger(__name__)
+
+SENTIMENT_LABELS = np.array(["negative", "neutral", "positive"])
+ROLES = ("keywords", "positive_indicators", "negative_indicators")
+
+
+class TermMatrixScorer:
+    """
+    Scores many articles against every preset at once
+
+    Each role (keywords, positive and negative indicators) becomes a sparse
+    term x preset count matrix, so per-preset match counts for a batch are a
+    single product with the article x term incidence matrix. The sentiment
+    thresholds and bonuses of calculate_relevance_score are then applied as
+    array operations.
+    """
+
+    def __init__(self, presets: Optional[Dict] = None, violent_keywords: Optional[List[str]] = None,
+                 weights: Optional[Dict] = None):
+        """
+        Args:
+            presets: Preset configuration to score with (default: HARYANA_FILTER_PRESETS)
+            violent_keywords: Violent vocabulary (default: VIOLENT_KEYWORDS)
+            weights: Sentiment weights (default: haryana_config.SENTIMENT_WEIGHTS at scoring time)
+        """
+        self.presets = presets if presets is not None else HARYANA_FILTER_PRESETS
+        self.violent_keywords = violent_keywords if violent_keywords is not None else VIOLENT_KEYWORDS
+        self.weights = weights
+        self.preset_keys = list(self.presets.keys())
+        # Stamped on persisted scores; only the live configuration matches scoring_fingerprint()
+        self.config_hash = haryana_config.config_fingerprint(
+            self.presets,
+            self.weights if self.weights is not None else haryana_config.SENTIMENT_WEIGHTS,
+            self.violent_keywords,
+        )
+
+        vocabularies = {(None, "violent"): self.violent_keywords}
+        for preset_key, preset in self.presets.items():
+            for role in ROLES:
+                vocabularies[(preset_key, role)] = preset[role]
+        self.matcher = KeywordMatcher(vocabularies)
+
+        self.terms = sorted({term.lower() for terms in vocabularies.values() for term in terms if term})
+        self.term_index = {term: i for i, term in enumerate(self.terms)}
+        self.violent_terms = frozenset(term.lower() for term in self.violent_keywords)
+
+        # Duplicated entries in a preset list count twice, exactly like the scalar scorer
+        self.role_matrices = {role: self._role_matrix(role) for role in ROLES}
+        self.violent_vector = self._term_vector(self.violent_keywords)
+
+    def _role_matrix(self, role):
+        rows, cols = [], []
+        for col, preset_key in enumerate(self.preset_keys):
+            for term in self.presets[preset_key][role]:
+                if term:
+                    rows.append(self.term_index[term.lower()])
+                    cols.append(col)
+        data = np.ones(len(rows), dtype=np.int64)
+        return sparse.csr_matrix((data, (rows, cols)), shape=(len(self.terms), len(self.preset_keys)))
+
+    def _term_vector(self, terms):
+        vector = np.zeros(len(self.terms), dtype=np.int64)
+        for term in set(term.lower() for term in terms if term):
+            vector[self.term_index[term]] = 1
+        return vector
+
+    def analyze(self, texts: List[str]) -> Dict:
+        """
+        Scan a batch of article texts once each
+
+        Returns:
+            dict with sparse incidence matrices "full", "title" and "lead"
+            (articles x terms) and the per-article "found_terms" sets
+        """
+        found_terms = []
+        title_terms = []
+        lead_terms = []
+        for text in texts:
+            text_lower = text.lower()
+            found = self.matcher.terms_in(text_lower)
+            title, lead = set(), set()
+            # Title and lead only matter for the violent gate
+            violent = found & self.violent_terms
+            if violent:
+                title = self.matcher.terms_in(text.split('.')[0].split('\n')[0].lower())
+                if len(violent) >= 2:
+                    lead = self.matcher.terms_in(text_lower[:VIOLENT_CONTENT_WINDOW])
+            found_terms.append(found)
+            title_terms.append(title)
+            lead_terms.append(lead)
+
+        return {
+            "full": self._incidence(found_terms),
+            "title": self._incidence(title_terms),
+            "lead": self._incidence(lead_terms),
+            "found_terms": found_terms,
+            "title_terms": title_terms,
+            "lead_terms": lead_terms,
+        }
+
+    def _incidence(self, term_sets):
+        indptr = [0]
+        indices = []
+        for terms in term_sets:
+            indices.extend(sorted(self.term_index[term] for term in terms))
+            indptr.append(len(indices))
+        data = np.ones(len(indices), dtype=np.int64)
+        return sparse.csr_matrix((data, indices, indptr), shape=(len(term_sets), len(self.terms)))
+
+    def score(self, texts: List[str]) -> Dict:
+        """
+        Score a batch of article texts against every preset
+
+        Returns:
+            dict with "presets" (column order), "scores", "sentiments",
+            "keyword_counts", "positive_counts", "negative_counts"
+            (articles x presets arrays), "violent" (per-article mask),
+            "best_preset" (per-article preset key) and the "analysis" used
+        """
+        return self.score_analysis(self.analyze(texts))
+
+    def score_analysis(self, analysis: Dict) -> Dict:
+        """
+        Score an analyze() result
+
+        Scanning the text is the expensive part, so when tuning weights the
+        same analysis can be rescored with different scorers at array speed.
+        """
+        weights = self.weights if self.weights is not None else haryana_config.SENTIMENT_WEIGHTS
+        full = analysis["full"]
+        n_articles = full.shape[0]
+
+        keyword_counts = (full @ self.role_matrices["keywords"]).toarray()
+        positive_counts = (full @ self.role_matrices["positive_indicators"]).toarray()
+        negative_counts = (full @ self.role_matrices["negative_indicators"]).toarray()
+
+        # Violent gate: any violent term in the title, or two or more in the lead
+        title_violent = analysis["title"] @ self.violent_vector > 0
+        lead_violent = analysis["lead"] @ self.violent_vector >= 2
+        violent = title_violent | lead_violent
+
+        has_keywords = keyword_counts > 0
+        sentiment_score = (
+            positive_counts * weights["positive_indicator"] +
+            negative_counts * weights["negative_indicator"]
+        )
+
+        # 0 = negative, 1 = neutral, 2 = positive (indexes SENTIMENT_LABELS)
+        sentiment_code = np.where(sentiment_score > 2, 2, np.where(sentiment_score < -1, 0, 1))
+        multiplier = np.select([sentiment_code == 0, sentiment_code == 1], [10, 5], 8)
+        offset = np.select([sentiment_code == 0, sentiment_code == 1], [-100, -20], 20)
+        # Same operation order as the scalar scorer so results match bit for bit
+        scores = (keyword_counts * 10 + sentiment_score * multiplier) + offset
+        scores = scores - negative_counts * 30
+        scores = scores + np.where(positive_counts >= 3, 25, 0)
+
+        # No keyword match: only negative indicators count
+        scores = np.where(has_keywords, scores, np.where(negative_counts > 0, -100.0, 0.0))
+        sentiment_code = np.where(has_keywords, sentiment_code, np.where(negative_counts > 0, 0, 1))
+        positive_counts = np.where(has_keywords, positive_counts, 0)
+
+        violent_rows = violent[:, None]
+        scores = np.where(violent_rows, -10000.0, scores)
+        sentiment_code = np.where(violent_rows, 0, sentiment_code)
+        keyword_counts = np.where(violent_rows, 0, keyword_counts)
+        positive_counts = np.where(violent_rows, 0, positive_counts)
+        if violent.any():
+            violent_negative = np.array([
+                len(self._violent_matches(analysis, i)) if violent[i] else 0
+                for i in range(n_articles)
+            ])
+            negative_counts = np.where(violent_rows, violent_negative[:, None], negative_counts)
+
+        # argmax returns the first maximum, matching the scalar "first best wins" loop
+        best_index = np.argmax(scores, axis=1) if n_articles else np.array([], dtype=np.int64)
+
+        return {
+            "presets": self.preset_keys,
+            "scores": scores,
+            "sentiments": SENTIMENT_LABELS[sentiment_code],
+            "keyword_counts": keyword_counts,
+            "positive_counts": positive_counts,
+            "negative_counts": negative_counts,
+            "violent": violent,
+            "best_preset": [self.preset_keys[i] for i in best_index],
+            "analysis": analysis,
+        }
+
+    def _violent_matches(self, analysis, article_index):
+        title_terms = analysis["title_terms"][article_index]
+        for violent_kw in self.violent_keywords:
+            if violent_kw.lower() in title_terms:
+                return [violent_kw]
+        lead_terms = analysis["lead_terms"][article_index]
+        return [kw for kw in self.violent_keywords if kw.lower() in lead_terms][:3]
+
+    def result(self, scored: Dict, article_index: int, preset_key: str) -> Dict:
+        """
+        Build the calculate_relevance_score-style dict for one article and preset
+
+        Match lists are only materialised here, so bulk callers that need
+        just the numbers never pay for them.
+        """
+        col = self.preset_keys.index(preset_key)
+        analysis = scored["analysis"]
+        found = analysis["found_terms"][article_index]
+        score = scored["scores"][article_index, col]
+
+        if scored["violent"][article_index]:
+            matched, positive, negative = [], [], self._violent_matches(analysis, article_index)
+        else:
+            matched = self.matcher.select((preset_key, "keywords"), found)
+            negative = self.matcher.select((preset_key, "negative_indicators"), found)
+            positive = self.matcher.select((preset_key, "positive_indicators"), found) if matched else []
+
+        return {
+            "score": score.item(),
+            "matched_keywords": matched,
+            "positive_matches": positive,
+            "negative_matches": negative,
+            "sentiment": str(scored["sentiments"][article_index, col]),
+        }
+
+
+def rescore_batch(db, articles, scorer: TermMatrixScorer) -> None:
+    """
+    Replace the stored ArticleScore rows of a batch of articles (caller commits)
+
+    Rows are stamped with the scorer's config_hash, so scores from a scorer
+    built with custom presets or weights stay stale for the rescore job.
+
+    Args:
+        db: Database session
+        articles: Rows with id, title and content
+        scorer: Scorer to use
+    """
+    from main import ArticleScore, ArticleTerm, bump_ingest_generation
+    from article_scores import score_mappings
+    from term_index import delete_postings, posting_mappings
+
+    texts = [f"{article.title} {article.content}" for article in articles]
+    scored = scorer.score(texts)
+    article_ids = [article.id for article in articles]
+
+    db.query(ArticleScore).filter(
+        ArticleScore.article_id.in_(article_ids)
+    ).delete(synchronize_session=False)
+    delete_postings(db, article_ids)
+    score_rows = []
+    postings = []
+    for i, article_id in enumerate(article_ids):
+        results = {
+            preset_key: scorer.result(scored, i, preset_key)
+            for preset_key in scorer.preset_keys
+        }
+        relevant = haryana_config.is_haryana_relevant(texts[i])
+        score_rows.extend(score_mappings(article_id, results, scored["best_preset"][i], relevant, scorer.config_hash))
+        if scorer.presets is HARYANA_FILTER_PRESETS:
+            found_terms = scored["analysis"]["found_terms"][i]
+        else:
+            # Postings always follow the live preset vocabulary
+            _, _, found_terms = haryana_config.analyze_text(texts[i]).scoring_terms
+        postings.extend(posting_mappings(article_id, found_terms))
+    db.bulk_insert_mappings(ArticleScore, score_rows)
+    db.bulk_insert_mappings(ArticleTerm, postings)
+    bump_ingest_generation(db)
+
+
+def rescore_articles(batch_size: int = 1000, scorer: Optional[TermMatrixScorer] = None) -> int:
+    """
+    Recompute the stored ArticleScore rows of every article in id-ordered batches
+
+    Returns:
+        Number of articles rescored
+    """
+    from main import Article, SessionLocal
+
+    scorer = scorer or TermMatrixScorer()
+    db = SessionLocal()
+    rescored = 0
+    last_id = 0
+
+    try:
+        while True:
+            articles = db.query(Article.id, Article.title, Article.content).filter(
+                Article.id > last_id
+            ).order_by(Article.id).limit(batch_size).all()
+            if not articles:
+                break
+
+            rescore_batch(db, articles, scorer)
+            db.commit()
+
+            rescored += len(articles)
+            last_id = articles[-1].id
+            logger.info(f"Rescored {rescored} articles")
+
+    except Exception as e:
+        logger.error(f"Error rescoring articles: {str(e)}")
+        db.rollback()
+    finally:
+        db.close()
+
+    return rescored
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print(f"✅ Rescored {rescore_articles()} articles")
@@ -32,12 +32,23 @@ def scrape_news_sources():
         "timestamp": "2024-01-01T00:00:00Z"  # You'd use datetime.utcnow().isoformat()
     }
 
+@celery_app.task
+def rescore_stale_articles():
+    """Celery task to rescore articles scored under an older scoring config"""
+    from rescore_job import rescore_stale_articles as run_rescore
+    
+    return run_rescore()
+
 # Schedule periodic tasks
 celery_app.conf.beat_schedule = {
     "scrape-news-every-30-minutes": {
         "task": "celery_tasks.scrape_news_sources",
         "schedule": 30.0 * 60.0,  # 30 minutes
     },
+    "rescore-stale-articles-every-hour": {
+        "task": "celery_tasks.rescore_stale_articles",
+        "schedule": 60.0 * 60.0,  # 1 hour
+    },
 }
 
 celery_app.conf.timezone = "UTC"
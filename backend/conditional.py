@@ -0,0 +1,48 @@
+"""
+HTTP conditional request helpers (ETag / Last-Modified)
+List endpoints derive a validator from cheap state (the ingest generation, a
+few aggregates, the query parameters) before running their query, so a client
+polling an unchanged list gets a 304 without the query, scoring or body.
+Small tables edited in place (sources, posts) hash the rows they return instead.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Mapping, Optional
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag for the given validator parts (anything with a stable repr)"""
+    return '"' + hashlib.sha1(repr(parts).encode()).hexdigest()[:20] + '"'
+
+
+def http_date(moment: datetime) -> str:
+    """RFC 7231 date for a naive UTC datetime"""
+    return format_datetime(moment.replace(tzinfo=timezone.utc, microsecond=0), usegmt=True)
+
+
+def is_not_modified(request_headers: Mapping[str, str], etag: str, last_modified: Optional[datetime]) -> bool:
+    """
+    Whether a GET with these headers can be answered with 304 Not Modified
+
+    If-None-Match takes precedence over If-Modified-Since (RFC 7232 section 6).
+    """
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # Weak comparison: W/"x" matches "x"
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag in candidates
+
+    if_modified_since = request_headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return last_modified.replace(tzinfo=timezone.utc, microsecond=0) <= since
+    return False
@@ -0,0 +1,100 @@
+"""
+Full-text search index for articles
+SQLite gets an FTS5 virtual table kept in sync by triggers. /search then
+answers from the index with rank-ordered results and highlighted snippets
+instead of scanning every content blob with LIKE '%q%'. Other databases
+(including PostgreSQL) keep the LIKE search.
+"""
+
+import logging
+import re
+from typing import List, Optional
+
+from sqlalchemy import Column, Integer, MetaData, Table, Text, func, literal_column, text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+SNIPPET_WORDS = 24
+TITLE_WEIGHT = 10.0  # A title hit ranks like ten content hits (SQLite bm25 column weight)
+
+# Not part of Base.metadata: create_all() must not try to create it as a plain table
+articles_fts = Table(
+    "articles_fts", MetaData(),
+    Column("rowid", Integer),
+    Column("title", Text),
+    Column("content", Text),
+)
+
+SQLITE_SETUP = [
+    """CREATE VIRTUAL TABLE articles_fts USING fts5(
+        title, content, content='articles', content_rowid='id', tokenize='porter unicode61'
+    )""",
+    "INSERT INTO articles_fts(articles_fts) VALUES('rebuild')",
+]
+
+SQLITE_TRIGGERS = [
+    """CREATE TRIGGER IF NOT EXISTS articles_fts_ai AFTER INSERT ON articles BEGIN
+        INSERT INTO articles_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS articles_fts_ad AFTER DELETE ON articles BEGIN
+        INSERT INTO articles_fts(articles_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS articles_fts_au AFTER UPDATE OF title, content ON articles BEGIN
+        INSERT INTO articles_fts(articles_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO articles_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END""",
+]
+
+def ensure_fulltext_index(engine: Engine) -> Optional[str]:
+    """
+    Create the full-text index for the engine's database if it is missing
+
+    Returns:
+        "fts5", or None when only LIKE search is available
+    """
+    if engine.dialect.name != "sqlite":
+        return None
+    try:
+        with engine.begin() as conn:
+            exists = conn.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+            )).first()
+            if not exists:
+                # Builds the index from the articles already stored
+                for statement in SQLITE_SETUP:
+                    conn.execute(text(statement))
+            for statement in SQLITE_TRIGGERS:
+                conn.execute(text(statement))
+            return "fts5"
+    except Exception as e:
+        logger.warning(f"Full-text index not available, falling back to LIKE search: {str(e)}")
+    return None
+
+
+def query_terms(q: str) -> List[str]:
+    """Words of a search box query; operators and punctuation are ignored"""
+    return re.findall(r"\w+", q.lower())
+
+
+def search_columns(q: str):
+    """
+    Match, rank and snippet expressions for a query on the FTS5 index
+
+    Every word must match, the last one as a prefix so results follow the
+    search box as it is typed. Higher relevance is better.
+
+    Returns:
+        (match clause, relevance expression, snippet expression, FTS table to join)
+    """
+    terms = query_terms(q)
+    match = " ".join(f'"{term}"' for term in terms[:-1])
+    match = f'{match} "{terms[-1]}"*'.strip()
+    clause = literal_column("articles_fts").op("MATCH")(match)
+    relevance = -func.bm25(literal_column("articles_fts"), TITLE_WEIGHT, 1.0)
+    snippet = func.snippet(
+        literal_column("articles_fts"), -1, HIGHLIGHT_START, HIGHLIGHT_END, "…", SNIPPET_WORDS
+    )
+    return clause, relevance, snippet, articles_fts
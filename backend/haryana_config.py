@@ -3,6 +3,11 @@ Haryana News Configuration
 Specialized configuration for tracking Haryana-related news with topic-based filtering
 """
 
+import hashlib
+import json
+import re
+from functools import cached_property, lru_cache
+
 # Haryana-specific news sources (RSS feeds)
 HARYANA_NEWS_SOURCES = [
     {
@@ -316,12 +321,150 @@ SENTIMENT_WEIGHTS = {
     "neutral": 0.0
 }
 
+# Violent/crime vocabulary - articles hitting these never appear in ANY category
+VIOLENT_KEYWORDS = [
+    "kill", "kills", "killed", "killing", "murder", "murdered", "murderer",
+    "assault", "violence", "violent", "attack", "attacked", "arrest", "arrested",
+    "crime", "criminal", "throat", "slitting", "stab", "stabbing", "shoot",
+    "shooting", "dead", "death", "died", "dies", "suicide", "rape", "raped",
+    "robbery", "theft", "burglary", "abuse", "abused", "victim", "victims",
+    "homicide", "manslaughter", "assassination", "terrorism", "terrorist",
+    "bomb", "explosion", "explosive", "weapon", "weapons", "gun", "guns"
+]
+
+VIOLENT_TERMS = frozenset(VIOLENT_KEYWORDS)
+
+# Number of leading characters checked for multiple violent keywords
+VIOLENT_CONTENT_WINDOW = 300
+
+
+class KeywordMatcher:
+    """
+    Single-pass multi-pattern matcher for the scoring vocabularies
+
+    All terms are compiled into one trie-shaped regex wrapped in a lookahead, so
+    a single walk over the text finds the longest term starting at every
+    position. Every shorter term that is a prefix of that match is present
+    too, which makes the result identical to running `term in text` for each
+    term - overlapping terms ("develop", "development") included.
+    """
+
+    def __init__(self, vocabularies):
+        """
+        Args:
+            vocabularies: dict mapping a tag (e.g. (preset_key, role)) to a list of terms
+        """
+        self.vocabularies = {
+            tag: [(term, term.lower()) for term in terms]
+            for tag, terms in vocabularies.items()
+        }
+        vocabulary = {lowered for terms in self.vocabularies.values() for _, lowered in terms if lowered}
+        self._prefixes = {
+            term: tuple(term[:i] for i in range(1, len(term) + 1) if term[:i] in vocabulary)
+            for term in vocabulary
+        }
+        self._pattern = re.compile("(?=(" + self._trie_pattern(vocabulary) + "))")
+
+    @classmethod
+    def _trie_pattern(cls, terms):
+        trie = {}
+        for term in terms:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        return cls._render(trie)
+
+    @classmethod
+    def _render(cls, node):
+        branches = [re.escape(char) + cls._render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        is_terminal = "" in node
+        if len(branches) == 1 and not is_terminal:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        # Greedy optional group keeps the longest match at each position
+        return group + "?" if is_terminal else group
+
+    def terms_in(self, text_lower):
+        """Return the set of lowercased vocabulary terms occurring in text_lower"""
+        found = set()
+        for longest in set(self._pattern.findall(text_lower)):
+            found.update(self._prefixes[longest])
+        return found
+
+    def scan(self, text_lower):
+        """
+        Return every hit in text_lower, tagged by vocabulary
+
+        Returns:
+            dict mapping each tag to the matching terms, in vocabulary order
+        """
+        found = self.terms_in(text_lower)
+        return {tag: self.select(tag, found) for tag in self.vocabularies}
+
+    def select(self, tag, found):
+        """Return the terms of one vocabulary present in a terms_in() result, in vocabulary order"""
+        return [term for term, lowered in self.vocabularies[tag] if lowered in found]
+
+
+def _build_scoring_matcher():
+    vocabularies = {(None, "violent"): VIOLENT_KEYWORDS}
+    for preset_key, preset in HARYANA_FILTER_PRESETS.items():
+        for role in ("keywords", "positive_indicators", "negative_indicators"):
+            vocabularies[(preset_key, role)] = preset[role]
+    return KeywordMatcher(vocabularies)
+
+
+SCORING_MATCHER = _build_scoring_matcher()
+
+
+def config_fingerprint(presets, weights, violent_keywords):
+    """
+    Hash of every configuration value that affects scoring
+    
+    Args:
+        presets: Preset configuration scored with
+        weights: Sentiment weights scored with
+        violent_keywords: Violent vocabulary scored with
+    
+    Returns:
+        16 hex digits; the locations and violent content window are always the live ones
+    """
+    config = {
+        "presets": {
+            key: {role: preset[role] for role in ("keywords", "positive_indicators", "negative_indicators")}
+            for key, preset in presets.items()
+        },
+        "locations": HARYANA_LOCATIONS,
+        "weights": weights,
+        "violent_keywords": violent_keywords,
+        "violent_content_window": VIOLENT_CONTENT_WINDOW,
+        "location_matching": "word_boundary",
+    }
+    payload = json.dumps(config, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+# The configuration is fixed for the life of the process, so it is hashed once
+@lru_cache(maxsize=1)
+def scoring_fingerprint():
+    """
+    Fingerprint of the live scoring configuration
+    
+    Stored with each persisted score so rows computed under an older
+    configuration can be found and rescored.
+    """
+    return config_fingerprint(HARYANA_FILTER_PRESETS, SENTIMENT_WEIGHTS, VIOLENT_KEYWORDS)
+
+
 def calculate_relevance_score(article_text, filter_preset_key):
     """
     Calculate relevance score for an article based on filter preset
     
     Args:
-        article_text: Combined title and content of article
+        article_text: Combined title and content of article (str or AnalyzedText)
         filter_preset_key: Key from HARYANA_FILTER_PRESETS
     
     Returns:
@@ -330,24 +473,53 @@ def calculate_relevance_score(article_text, filter_preset_key):
     if filter_preset_key not in HARYANA_FILTER_PRESETS:
         return {"score": 0, "matched_keywords": [], "sentiment": "neutral"}
     
+    title_terms, content_start_terms, found_terms = analyze_text(article_text).scoring_terms
+    
     # CRITICAL FIX: Filter out violent/crime articles immediately - BEFORE any category matching
     # These should NEVER appear in ANY category, regardless of keywords
-    violent_keywords = [
-        "kill", "kills", "killed", "killing", "murder", "murdered", "murderer",
-        "assault", "violence", "violent", "attack", "attacked", "arrest", "arrested",
-        "crime", "criminal", "throat", "slitting", "stab", "stabbing", "shoot",
-        "shooting", "dead", "death", "died", "dies", "suicide", "rape", "raped",
-        "robbery", "theft", "burglary", "abuse", "abused", "victim", "victims",
-        "homicide", "manslaughter", "assassination", "terrorism", "terrorist",
-        "bomb", "explosion", "explosive", "weapon", "weapons", "gun", "guns"
-    ]
+    violent_result = _violent_gate(title_terms, content_start_terms)
+    if violent_result is not None:
+        return violent_result
     
-    article_lower = article_text.lower()
-    title = article_text.split('.')[0].split('\n')[0].lower()  # First sentence or first line
+    return _score_preset(filter_preset_key, found_terms)
+
+
+def score_all_presets(article_text):
+    """
+    Score an article against every filter preset in one pass
+    
+    The lowercasing, title extraction and violent-content gate are shared
+    across presets instead of being repeated for each one.
+    
+    Args:
+        article_text: Combined title and content of article (str or AnalyzedText)
+    
+    Returns:
+        dict with "results" ({preset_key: calculate_relevance_score result})
+        and "best_preset" (the highest scoring preset key)
+    """
+    title_terms, content_start_terms, found_terms = analyze_text(article_text).scoring_terms
+    violent_result = _violent_gate(title_terms, content_start_terms)
+    
+    results = {}
+    best_preset = None
+    for preset_key in HARYANA_FILTER_PRESETS:
+        if violent_result is not None:
+            result = dict(violent_result)
+        else:
+            result = _score_preset(preset_key, found_terms)
+        results[preset_key] = result
+        if best_preset is None or result["score"] > results[best_preset]["score"]:
+            best_preset = preset_key
     
+    return {"results": results, "best_preset": best_preset}
+
+
+def _violent_gate(title_terms, content_start_terms):
+    """Return the blocking result for violent/crime articles, or None if the article passes"""
     # Check for violent keywords in title (most reliable indicator)
-    for violent_kw in violent_keywords:
-        if violent_kw in title:
+    for violent_kw in VIOLENT_KEYWORDS:
+        if violent_kw in title_terms:
             return {
                 "score": -10000,  # Massive penalty to ensure it's completely filtered out
                 "matched_keywords": [],
@@ -357,8 +529,7 @@ def calculate_relevance_score(article_text, filter_preset_key):
             }
     
     # Also check first 300 chars of content for violent keywords (to catch violent news)
-    content_start = article_lower[:300]
-    violent_matches_in_content = [kw for kw in violent_keywords if kw in content_start]
+    violent_matches_in_content = [kw for kw in VIOLENT_KEYWORDS if kw in content_start_terms]
     if len(violent_matches_in_content) >= 2:  # Multiple violent keywords = likely violent news
         return {
             "score": -10000,
@@ -368,23 +539,20 @@ def calculate_relevance_score(article_text, filter_preset_key):
             "sentiment": "negative"
         }
     
-    preset = HARYANA_FILTER_PRESETS[filter_preset_key]
-    
+    return None
+
+
+def _score_preset(filter_preset_key, found_terms):
+    """Score one preset from the set of lowercased terms found in the article"""
     # Check for keywords
-    matched_keywords = []
-    for keyword in preset["keywords"]:
-        if keyword.lower() in article_lower:
-            matched_keywords.append(keyword)
+    matched_keywords = SCORING_MATCHER.select((filter_preset_key, "keywords"), found_terms)
     
     # CRITICAL FIX: Require at least one keyword match before applying positive indicators
     # This prevents generic positive words from scoring articles in wrong categories
     if len(matched_keywords) == 0:
         # No keywords matched - article is not relevant to this category
         # Only apply negative penalties (to filter out clearly negative content)
-        negative_matches = []
-        for indicator in preset["negative_indicators"]:
-            if indicator.lower() in article_lower:
-                negative_matches.append(indicator)
+        negative_matches = SCORING_MATCHER.select((filter_preset_key, "negative_indicators"), found_terms)
         
         if len(negative_matches) > 0:
             return {
@@ -408,16 +576,10 @@ def calculate_relevance_score(article_text, filter_preset_key):
     keyword_score = len(matched_keywords) * 10
     
     # Check for positive indicators (only if keywords matched)
-    positive_matches = []
-    for indicator in preset["positive_indicators"]:
-        if indicator.lower() in article_lower:
-            positive_matches.append(indicator)
+    positive_matches = SCORING_MATCHER.select((filter_preset_key, "positive_indicators"), found_terms)
     
     # Check for negative indicators
-    negative_matches = []
-    for indicator in preset["negative_indicators"]:
-        if indicator.lower() in article_lower:
-            negative_matches.append(indicator)
+    negative_matches = SCORING_MATCHER.select((filter_preset_key, "negative_indicators"), found_terms)
     
     # Calculate sentiment score
     sentiment_score = (
@@ -462,15 +624,145 @@ def calculate_relevance_score(article_text, filter_preset_key):
         "sentiment": sentiment
     }
 
+def score_articles_batch(rows):
+    """
+    Score a batch of articles against every preset
+    
+    Pure function over plain tuples so it can run in worker processes.
+    
+    Args:
+        rows: iterable of (article_id, title, content)
+    
+    Returns:
+        list of (article_id, score_all_presets result, is_haryana_relevant, scoring terms found)
+    """
+    scored = []
+    for article_id, title, content in rows:
+        analyzed = AnalyzedText(f"{title} {content}")
+        _, _, found_terms = analyzed.scoring_terms
+        scored.append((article_id, score_all_presets(analyzed), is_haryana_relevant(analyzed), found_terms))
+    return scored
+
+
+class LocationGazetteer:
+    """
+    Precompiled, word-boundary-aware matcher for HARYANA_LOCATIONS
+    
+    One scan of the lowercased text returns every location mention with its position.
+    Word boundaries stop short names matching inside other words ("Rai" in
+    "raise", "Jind" in "Jindal"). Most checks only need the first mention,
+    which usually sits in the title, so first() stops there instead of
+    scanning the whole article.
+    """
+    
+    def __init__(self, locations):
+        self._canonical = {location.lower(): location for location in locations}
+        # Trie-shaped alternation tries the longest name first at each position
+        self._pattern = re.compile(r"\b(?:" + KeywordMatcher._trie_pattern(self._canonical) + r")\b")
+    
+    def find(self, text_lower):
+        """
+        Return every location mention in lowercased text
+        
+        Returns:
+            tuple of (location, start, end), location as spelled in HARYANA_LOCATIONS
+        """
+        return tuple(
+            (self._canonical[match.group(0)], match.start(), match.end())
+            for match in self._pattern.finditer(text_lower)
+        )
+    
+    def first(self, text_lower):
+        """Return the first location mention in lowercased text as (location, start, end), or None"""
+        match = self._pattern.search(text_lower)
+        return (self._canonical[match.group(0)], match.start(), match.end()) if match else None
+
+
+HARYANA_GAZETTEER = LocationGazetteer(HARYANA_LOCATIONS)
+
+
+class AnalyzedText:
+    """
+    Normalized views of one article's text, computed once and shared by every check
+    
+    Relevance, primary-story, high-impact and scoring checks all accept an
+    AnalyzedText in place of the raw string, so an article is lowercased and
+    scanned once per ingest instead of once per check. Views other than the
+    lowercased text are computed on first use.
+    """
+    
+    def __init__(self, text):
+        self.text = text
+        self.lower = text.lower()
+    
+    @cached_property
+    def title(self):
+        """First sentence or first line, lowercased"""
+        return self.text.split('.')[0].split('\n')[0].lower()
+    
+    @cached_property
+    def locations(self):
+        """Haryana location mentions as (location, start, end)"""
+        return HARYANA_GAZETTEER.find(self.lower)
+    
+    @cached_property
+    def first_location(self):
+        """First Haryana location mention as (location, start, end), or None"""
+        if "locations" in self.__dict__:
+            return self.locations[0] if self.locations else None
+        return HARYANA_GAZETTEER.first(self.lower)
+    
+    @cached_property
+    def scoring_terms(self):
+        """
+        Scoring vocabulary found in the article
+        
+        Returns:
+            (title terms, terms in the first VIOLENT_CONTENT_WINDOW chars, terms in the full text)
+        """
+        found_terms = frozenset(SCORING_MATCHER.terms_in(self.lower))
+        
+        # Title and lead are substrings of the article, so they only need a scan
+        # when the full text already contains violent keywords
+        violent_terms = found_terms & VIOLENT_TERMS
+        if not violent_terms:
+            return frozenset(), frozenset(), found_terms
+        
+        title_terms = frozenset(SCORING_MATCHER.terms_in(self.title))
+        content_start_terms = frozenset()
+        if len(violent_terms) >= 2:
+            content_start_terms = frozenset(SCORING_MATCHER.terms_in(self.lower[:VIOLENT_CONTENT_WINDOW]))
+        return title_terms, content_start_terms, found_terms
+
+
+# Large enough to hold a whole feed between scoring in scrape_rss_feed and save_articles
+@lru_cache(maxsize=128)
+def _analyze_str(article_text):
+    return AnalyzedText(article_text)
+
+
+def analyze_text(article_text):
+    """
+    Return the AnalyzedText for article_text
+    
+    Accepts a str or an existing AnalyzedText. Strings are cached, so callers
+    that still pass the same raw text to several checks share one analysis.
+    """
+    if isinstance(article_text, AnalyzedText):
+        return article_text
+    return _analyze_str(article_text)
+
+
+def find_locations(article_text):
+    """All Haryana location mentions in article_text (str or AnalyzedText), with positions"""
+    return analyze_text(article_text).locations
+
+
 def is_haryana_relevant(article_text):
     """
-    Check if article is relevant to Haryana
+    Check if article is relevant to Haryana (article_text: str or AnalyzedText)
     """
-    article_lower = article_text.lower()
-    for location in HARYANA_LOCATIONS:
-        if location.lower() in article_lower:
-            return True
-    return False
+    return analyze_text(article_text).first_location is not None
 
 
 def is_article_positive(article_text):
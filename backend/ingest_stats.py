@@ -0,0 +1,175 @@
+"""
+Ingest statistics for /scrape/status
+save_articles adds each batch to a single IngestStats row and to per-hour
+IngestHourlyCount buckets in the same transaction as the articles, so the
+status endpoint reads one row and a handful of buckets instead of counting the
+whole articles table on every poll. Window counts are accurate to the hour: a
+window only includes whole buckets plus the current one, so it covers between
+N-1 and N hours and never overcounts. exact_ingest_stats() computes them
+precisely with one aggregate statement.
+"""
+
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from sqlalchemy import case, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from main import Article, IngestHourlyCount, IngestStats, Source, dialect_insert
+
+logger = logging.getLogger(__name__)
+
+# Buckets older than this are pruned; the longest window reported is 24h
+BUCKET_RETENTION = timedelta(hours=48)
+
+
+def _hour(moment: datetime) -> datetime:
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def record_ingest(db: Session, articles: List[Article]) -> None:
+    """
+    Add newly saved articles to the stats (caller commits with the articles)
+
+    Args:
+        db: Session the articles were added in
+        articles: Flushed Article rows (id and crawled_at populated)
+    """
+    if not articles:
+        return
+
+    latest = max(articles, key=lambda article: (article.crawled_at, article.id))
+    updated = db.query(IngestStats).filter(IngestStats.id == 1).update({
+        IngestStats.total_articles: IngestStats.total_articles + len(articles),
+        IngestStats.last_article_id: latest.id,
+        IngestStats.last_article_title: latest.title,
+        IngestStats.last_crawled_at: latest.crawled_at,
+        IngestStats.updated_at: datetime.utcnow(),
+    }, synchronize_session=False)
+    if not updated:
+        # No stats row yet: build it from the articles table, which already holds this batch
+        rebuild_ingest_stats(db)
+        return
+
+    # Atomic increments, so concurrent scrapers never lose counts
+    insert = dialect_insert(db)
+    for hour, count in Counter(_hour(article.crawled_at) for article in articles).items():
+        statement = insert(IngestHourlyCount).values(hour=hour, count=count)
+        db.execute(statement.on_conflict_do_update(
+            index_elements=[IngestHourlyCount.hour],
+            set_={"count": IngestHourlyCount.count + statement.excluded["count"]},
+        ))
+    db.query(IngestHourlyCount).filter(
+        IngestHourlyCount.hour < _hour(datetime.utcnow() - BUCKET_RETENTION)
+    ).delete(synchronize_session=False)
+
+
+def rebuild_ingest_stats(db: Session) -> None:
+    """Recompute the stats from the articles table (after deletes or direct inserts; caller commits)"""
+    now = datetime.utcnow()
+    total = db.query(func.count(Article.id)).scalar() or 0
+    latest = db.query(Article.id, Article.title, Article.crawled_at).order_by(
+        Article.crawled_at.desc(), Article.id.desc()
+    ).first()
+
+    stats = db.get(IngestStats, 1) or IngestStats(id=1)
+    stats.total_articles = total
+    stats.last_article_id = latest.id if latest else None
+    stats.last_article_title = latest.title if latest else None
+    stats.last_crawled_at = latest.crawled_at if latest else None
+    stats.updated_at = now
+    db.add(stats)
+
+    recent = db.query(Article.crawled_at).filter(Article.crawled_at >= _hour(now - BUCKET_RETENTION))
+    buckets = Counter(_hour(crawled_at) for crawled_at, in recent)
+    db.query(IngestHourlyCount).delete(synchronize_session=False)
+    db.add_all(IngestHourlyCount(hour=hour, count=count) for hour, count in buckets.items())
+    logger.info(f"Rebuilt ingest stats: {total} articles")
+
+
+def read_ingest_stats(db: Session) -> Dict:
+    """Status counts from the stats row and hourly buckets, in one query"""
+    now = datetime.utcnow()
+
+    def bucket_sum(since):
+        # The bucket containing `since` is only partly inside the window, so it is left out
+        return select(func.coalesce(func.sum(IngestHourlyCount.count), 0)).where(
+            IngestHourlyCount.hour > _hour(since)
+        ).scalar_subquery()
+
+    active_sources = select(func.count(Source.id)).where(Source.is_active == True).scalar_subquery()
+    row = db.query(
+        IngestStats,
+        bucket_sum(now - timedelta(days=1)).label("last_24h"),
+        bucket_sum(now - timedelta(hours=1)).label("last_hour"),
+        active_sources.label("active_sources"),
+    ).filter(IngestStats.id == 1).first()
+
+    if row is None:
+        # First read on a database that predates the stats row
+        try:
+            rebuild_ingest_stats(db)
+            db.commit()
+        except IntegrityError:
+            # A concurrent first read created it
+            db.rollback()
+        return read_ingest_stats(db)
+
+    stats = row.IngestStats
+    return {
+        "total_articles": stats.total_articles,
+        "last_24h": row.last_24h,
+        "last_hour": row.last_hour,
+        "latest_article": {
+            "title": stats.last_article_title,
+            "crawled_at": stats.last_crawled_at.isoformat(),
+        } if stats.last_crawled_at else None,
+        "active_sources": row.active_sources,
+        "exact": False,
+    }
+
+
+def exact_ingest_stats(db: Session) -> Dict:
+    """Exact status counts with a single conditional-aggregate statement over articles"""
+    now = datetime.utcnow()
+    latest_title = select(Article.title).order_by(
+        Article.crawled_at.desc(), Article.id.desc()
+    ).limit(1).correlate(None).scalar_subquery()
+    active_sources = select(func.count(Source.id)).where(Source.is_active == True).correlate(None).scalar_subquery()
+
+    row = db.query(
+        func.count(Article.id).label("total_articles"),
+        func.sum(case((Article.crawled_at >= now - timedelta(days=1), 1), else_=0)).label("last_24h"),
+        func.sum(case((Article.crawled_at >= now - timedelta(hours=1), 1), else_=0)).label("last_hour"),
+        func.max(Article.crawled_at).label("last_crawled_at"),
+        latest_title.label("last_article_title"),
+        active_sources.label("active_sources"),
+    ).one()
+
+    return {
+        "total_articles": row.total_articles,
+        "last_24h": row.last_24h or 0,
+        "last_hour": row.last_hour or 0,
+        "latest_article": {
+            "title": row.last_article_title,
+            "crawled_at": row.last_crawled_at.isoformat(),
+        } if row.last_crawled_at else None,
+        "active_sources": row.active_sources,
+        "exact": True,
+    }
+
+
+if __name__ == "__main__":
+    from main import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    db = SessionLocal()
+    try:
+        rebuild_ingest_stats(db)
+        db.commit()
+        print(f"✅ {read_ingest_stats(db)}")
+    finally:
+        db.close()
@@ -0,0 +1,93 @@
+"""
+Known-URL filter for feed entries
+Most entries in a feed were already stored on the previous poll. parse_feed
+skips scoring a feed whose entries are all stored, and drops stored entries
+from its top picks so save_articles does not check their relevance (or fetch
+them in full) again.
+
+The filter keeps the url_hash of every stored article (the 64-bit hash of its
+canonical URL) in a sorted numpy array (8 bytes per article), warmed once per
+process from the articles.url_hash index and caught up on each check with the
+articles inserted since (by id), so rows saved by this or any other process
+are seen. save_articles still does the exact duplicate check for anything the
+filter misses.
+"""
+
+import logging
+import threading
+from typing import Iterable, List
+
+import numpy as np
+
+from main import Article, SessionLocal
+from url_canonical import url_hash
+
+logger = logging.getLogger(__name__)
+
+# Pending fingerprints are merged into the sorted array past this size
+MERGE_THRESHOLD = 4096
+
+
+class KnownUrlFilter:
+    """Membership test for stored article URLs"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sorted = np.empty(0, dtype=np.int64)
+        self._pending = set()
+        self._last_id = None  # None until warmed
+
+    def _merge(self):
+        if self._pending:
+            self._sorted = np.union1d(self._sorted, np.fromiter(self._pending, dtype=np.int64, count=len(self._pending)))
+            self._pending.clear()
+
+    def _add(self, fingerprints: Iterable[int]):
+        self._pending.update(fingerprints)
+        if len(self._pending) > MERGE_THRESHOLD:
+            self._merge()
+
+    def refresh(self) -> None:
+        """Warm from articles.url on first use, then pick up articles inserted since the last call"""
+        with self._lock:
+            db = SessionLocal()
+            try:
+                if self._last_id is None:
+                    # Read the watermark first so rows inserted during the scan are caught next time
+                    self._last_id = db.query(Article.id).order_by(Article.id.desc()).limit(1).scalar() or 0
+                    hashes = db.query(Article.url_hash).filter(Article.url_hash.isnot(None))
+                    self._sorted = np.unique(np.fromiter((value for value, in hashes.yield_per(10000)), dtype=np.int64))
+                    logger.info(f"Known-URL filter warmed with {len(self._sorted)} URLs")
+                else:
+                    rows = db.query(Article.id, Article.url_hash).filter(Article.id > self._last_id).all()
+                    if rows:
+                        self._last_id = max(article_id for article_id, _ in rows)
+                        self._add(value for _, value in rows if value is not None)
+            finally:
+                db.close()
+
+    def contains_many(self, urls: List[str]) -> List[bool]:
+        """
+        Which URLs are already stored
+
+        Args:
+            urls: Candidate URLs (e.g. every entry link in a feed)
+
+        Returns:
+            One flag per URL, True if it is known
+        """
+        if not urls:
+            return []
+        self.refresh()
+        fingerprints = np.fromiter((url_hash(url) for url in urls), dtype=np.int64, count=len(urls))
+        with self._lock:
+            positions = np.searchsorted(self._sorted, fingerprints)
+            found = positions < len(self._sorted)
+            found[found] = self._sorted[positions[found]] == fingerprints[found]
+            return [bool(hit) or int(fingerprint) in self._pending for hit, fingerprint in zip(found, fingerprints)]
+
+    def __len__(self):
+        return len(self._sorted) + len(self._pending)
+
+
+known_urls = KnownUrlFilter()
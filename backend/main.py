@@ -1,14 +1,30 @@
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, Request, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text, Boolean
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy import and_, create_engine, event, inspect, or_, text, update, Column, Integer, BigInteger, String, DateTime, Text, Boolean, Float, JSON, Index, UniqueConstraint
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import sessionmaker, Session, load_only
 from pydantic import BaseModel
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Optional, Dict
 import os
+import sys
 from dotenv import load_dotenv
 
+from pagination import EXHAUSTED_HEADER, NEXT_CURSOR_HEADER, SCANNED_HEADER, after_cursor, decode_cursor, encode_cursor, next_cursor
+from fulltext import ensure_fulltext_index, query_terms, search_columns
+from response_cache import ResponseCache
+from conditional import http_date, is_not_modified, make_etag
+from article_stream import article_broker, stream_events
+from url_canonical import url_hash
+
+# Run as a script this module is __main__; register it as "main" too, so the modules that
+# import from main (article_scores, ingest_stats, ...) share it instead of loading a second copy
+if __name__ == "__main__":
+    sys.modules.setdefault("main", sys.modules[__name__])
+
 # Safely load environment variables from .env without crashing if file permissions are restricted
 try:
     load_dotenv()
@@ -16,7 +32,7 @@ except PermissionError as e:
     print(f"⚠️  Warning: could not load .env file due to permissions: {e}")
 
 try:
-    from haryana_config import HARYANA_FILTER_PRESETS, calculate_relevance_score, is_haryana_relevant
+    from haryana_config import HARYANA_FILTER_PRESETS, analyze_text, calculate_relevance_score, is_haryana_relevant, score_all_presets, scoring_fingerprint
     HARYANA_CONFIG_AVAILABLE = True
 except ImportError:
     HARYANA_CONFIG_AVAILABLE = False
@@ -42,6 +58,22 @@ class Source(Base):
     rss_feed = Column(String)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Feed validators from the last full response, sent back as If-None-Match / If-Modified-Since
+    etag = Column(String)
+    last_modified = Column(String)
+    last_fetched_at = Column(DateTime)
+    fetch_count = Column(Integer, default=0)
+    not_modified_count = Column(Integer, default=0)
+
+SUMMARY_LENGTH = 200
+
+def make_summary(content: Optional[str]) -> str:
+    """First ~SUMMARY_LENGTH characters of content, cut at a word boundary"""
+    text = " ".join((content or "").split())
+    if len(text) <= SUMMARY_LENGTH:
+        return text
+    cut = text[:SUMMARY_LENGTH].rsplit(" ", 1)[0]
+    return cut + "…"
 
 class Article(Base):
     __tablename__ = "articles"
@@ -52,6 +84,109 @@ class Article(Base):
     url = Column(String, unique=True, index=True)
     published_at = Column(DateTime)
     crawled_at = Column(DateTime, default=datetime.utcnow)
+    summary = Column(String(SUMMARY_LENGTH + 1))  # Leading text for list views (see make_summary)
+    url_hash = Column(BigInteger)  # Dedup key: 64-bit hash of the canonical url (see url_canonical.py)
+    __table_args__ = (
+        # Keyset pagination: ORDER BY published_at DESC, id DESC
+        Index("ix_articles_published_id", "published_at", "id"),
+        # NULL for legacy rows whose canonical url duplicates an earlier article
+        Index("ix_articles_url_hash", "url_hash", unique=True),
+    )
+
+@event.listens_for(Article, "before_insert")
+def set_article_summary(mapper, connection, article):
+    if article.summary is None:
+        article.summary = make_summary(article.content)
+    if article.url_hash is None and article.url:
+        article.url_hash = url_hash(article.url)
+
+class ArticleScore(Base):
+    __tablename__ = "article_scores"
+    id = Column(Integer, primary_key=True, index=True)
+    article_id = Column(Integer, index=True)
+    preset = Column(String)
+    score = Column(Float)
+    sentiment = Column(String)
+    is_best = Column(Boolean, default=False)
+    is_relevant = Column(Boolean, default=True)
+    matched_count = Column(Integer, default=0)
+    positive_count = Column(Integer, default=0)
+    negative_count = Column(Integer, default=0)
+    matched_keywords = Column(JSON)
+    positive_matches = Column(JSON)
+    negative_matches = Column(JSON)
+    config_hash = Column(String(16), index=True)
+    scored_at = Column(DateTime, default=datetime.utcnow)
+    __table_args__ = (
+        UniqueConstraint("article_id", "preset", name="uq_article_scores_article_preset"),
+        Index("ix_article_scores_preset_score", "preset", "score"),
+        Index("ix_article_scores_best_score", "is_best", "score"),
+    )
+
+class ArticleTerm(Base):
+    __tablename__ = "article_terms"
+    id = Column(Integer, primary_key=True, index=True)
+    term = Column(String)
+    article_id = Column(Integer, index=True)
+    __table_args__ = (
+        UniqueConstraint("term", "article_id", name="uq_article_terms_term_article"),
+    )
+
+class RescoreCheckpoint(Base):
+    __tablename__ = "rescore_checkpoints"
+    id = Column(Integer, primary_key=True, index=True)
+    config_hash = Column(String(16), unique=True, index=True)
+    status = Column(String, default="running")
+    last_article_id = Column(Integer, default=0)
+    stale_total = Column(Integer, default=0)
+    rescored_count = Column(Integer, default=0)
+    error = Column(Text)
+    started_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime)
+
+class IngestGeneration(Base):
+    # Single row; bumped whenever articles or their scores change (see bump_ingest_generation)
+    __tablename__ = "ingest_generation"
+    id = Column(Integer, primary_key=True)
+    generation = Column(Integer, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+class IngestStats(Base):
+    # Single row maintained by save_articles (see ingest_stats.py)
+    __tablename__ = "ingest_stats"
+    id = Column(Integer, primary_key=True)
+    total_articles = Column(Integer, default=0)
+    last_article_id = Column(Integer)
+    last_article_title = Column(String)
+    last_crawled_at = Column(DateTime)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+class IngestHourlyCount(Base):
+    __tablename__ = "ingest_hourly_counts"
+    hour = Column(DateTime, primary_key=True)  # crawled_at truncated to the hour
+    count = Column(Integer, default=0)
+
+class ScrapeJob(Base):
+    __tablename__ = "scrape_jobs"
+    id = Column(Integer, primary_key=True, index=True)
+    status = Column(String, default="queued", index=True)  # queued, running, completed, failed
+    sources_total = Column(Integer, default=0)
+    sources_done = Column(Integer, default=0)
+    articles_found = Column(Integer, default=0)
+    new_articles = Column(Integer, default=0)
+    sources = Column(JSON)  # Per-source progress, in scrape order
+    errors = Column(JSON)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime)
+
+class AppliedMigration(Base):
+    # Data backfills already run on this database (see run_data_migrations)
+    __tablename__ = "applied_migrations"
+    name = Column(String, primary_key=True)
+    applied_at = Column(DateTime, default=datetime.utcnow)
 
 class Filter(Base):
     __tablename__ = "filters"
@@ -94,6 +229,11 @@ class ArticleResponse(BaseModel):
     url: str
     published_at: datetime
     crawled_at: datetime
+    summary: Optional[str] = None
+
+class SearchResultResponse(ArticleResponse):
+    snippet: Optional[str] = None
+    relevance: Optional[float] = None
 
 class FilterCreate(BaseModel):
     name: str
@@ -126,6 +266,143 @@ class TweetRequest(BaseModel):
 
 Base.metadata.create_all(bind=engine)
 
+# Columns added to tables that may already exist; create_all() never alters existing tables
+ADDED_COLUMNS = {
+    "article_scores": {"config_hash": "VARCHAR(16)"},
+    "articles": {"summary": f"VARCHAR({SUMMARY_LENGTH + 1})", "url_hash": "BIGINT"},
+    "sources": {
+        "etag": "VARCHAR",
+        "last_modified": "VARCHAR",
+        "last_fetched_at": "TIMESTAMP",
+        "fetch_count": "INTEGER DEFAULT 0",
+        "not_modified_count": "INTEGER DEFAULT 0",
+    },
+}
+
+def ensure_added_columns():
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table, columns in ADDED_COLUMNS.items():
+            existing = {column["name"] for column in inspector.get_columns(table)}
+            for name, ddl_type in columns.items():
+                if name not in existing:
+                    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl_type}"))
+
+# Indexes added to tables that may already exist
+ADDED_INDEXES = [index for index in Article.__table__.indexes if index.name in ("ix_articles_published_id", "ix_articles_url_hash")]
+
+def ensure_added_indexes():
+    for index in ADDED_INDEXES:
+        index.create(bind=engine, checkfirst=True)
+
+def backfill_article_summaries(batch_size: int = 1000):
+    # Rows stored before the summary column existed
+    with SessionLocal() as db:
+        while True:
+            articles = db.query(Article).options(load_only(Article.id, Article.content)).filter(
+                Article.summary.is_(None)
+            ).limit(batch_size).all()
+            if not articles:
+                break
+            for article in articles:
+                article.summary = make_summary(article.content)
+            db.commit()
+
+def backfill_url_hashes(batch_size: int = 5000):
+    # Rows stored before the url_hash column existed. A row whose canonical url matches an
+    # earlier article's keeps a NULL hash (the unique index allows it) and is reported.
+    duplicates = 0
+    last_id = 0
+    with SessionLocal() as db:
+        while True:
+            rows = db.query(Article.id, Article.url).filter(
+                Article.url_hash.is_(None), Article.id > last_id
+            ).order_by(Article.id).limit(batch_size).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+            hashes = {row.id: url_hash(row.url) for row in rows if row.url}
+            taken = {value for value, in db.query(Article.url_hash).filter(Article.url_hash.in_(set(hashes.values())))}
+            updates = []
+            for article_id, value in hashes.items():
+                if value in taken:
+                    duplicates += 1
+                    continue
+                taken.add(value)
+                updates.append({"id": article_id, "url_hash": value})
+            if updates:
+                db.execute(update(Article), updates)
+            db.commit()
+    if duplicates:
+        print(f"⚠️  Warning: {duplicates} articles share a canonical url with an earlier article; their url_hash is left empty")
+
+def backfill_scores_and_postings():
+    # Articles stored before scores and postings were written at ingest
+    from article_scores import backfill_article_scores
+    backfill_article_scores()
+
+# Backfills for rows stored before a column or table existed; each runs once per database, since
+# rows inserted afterwards always get them (and url_hash duplicates stay NULL for good)
+DATA_MIGRATIONS = [
+    ("article_summaries", backfill_article_summaries),
+    ("article_url_hashes", backfill_url_hashes),
+    ("article_scores_and_postings", backfill_scores_and_postings),
+]
+
+def run_data_migrations():
+    with SessionLocal() as db:
+        applied = {name for name, in db.query(AppliedMigration.name)}
+        for name, migration in DATA_MIGRATIONS:
+            if name in applied:
+                continue
+            migration()
+            db.add(AppliedMigration(name=name))
+            try:
+                db.commit()
+            except IntegrityError:
+                # Recorded by another process that ran it at the same time
+                db.rollback()
+
+ensure_added_columns()
+ensure_added_indexes()
+FULLTEXT_BACKEND = ensure_fulltext_index(engine)
+
+def ensure_ingest_generation():
+    with SessionLocal() as db:
+        if not db.get(IngestGeneration, 1):
+            db.add(IngestGeneration(id=1, generation=0))
+            db.commit()
+
+def get_ingest_state(db: Session):
+    """(generation, updated_at) of the article data"""
+    state = db.query(IngestGeneration.generation, IngestGeneration.updated_at).filter(IngestGeneration.id == 1).first()
+    return (state.generation, state.updated_at) if state else (0, None)
+
+def bump_ingest_generation(db: Session):
+    """Invalidate cached list responses in every API process (caller commits with its writes)"""
+    db.query(IngestGeneration).filter(IngestGeneration.id == 1).update(
+        {IngestGeneration.generation: IngestGeneration.generation + 1, IngestGeneration.updated_at: datetime.utcnow()},
+        synchronize_session=False,
+    )
+
+def dialect_insert(db: Session):
+    """insert() construct with on_conflict_do_* support for the session's database (SQLite or Postgres)"""
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+ensure_ingest_generation()
+# After bump_ingest_generation exists: the score backfill imports modules that import it from main
+run_data_migrations()
+
+response_cache = ResponseCache(
+    maxsize=int(os.getenv("RESPONSE_CACHE_SIZE", "256")),
+    ttl=float(os.getenv("RESPONSE_CACHE_TTL", "300")),
+)
+CACHED_HEADERS = {name.lower() for name in (NEXT_CURSOR_HEADER, SCANNED_HEADER, EXHAUSTED_HEADER)}
+
 app = FastAPI(title="News Screener API")
 
 app.add_middleware(
@@ -134,8 +411,90 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, SCANNED_HEADER, EXHAUSTED_HEADER, "ETag", "Last-Modified"],
 )
 
+def parse_cursor(cursor: str, types):
+    try:
+        return decode_cursor(cursor, types)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def paginate_articles(query, response: Response, limit: int, offset: int, cursor: Optional[str]):
+    # Cursor pages seek on ix_articles_published_id; offset stays as a fallback
+    query = query.order_by(Article.published_at.desc(), Article.id.desc())
+    if cursor:
+        query = query.filter(after_cursor((Article.published_at, Article.id), parse_cursor(cursor, (datetime, int))))
+    else:
+        query = query.offset(offset)
+    articles = query.limit(limit).all()
+    cursor_after = next_cursor(articles, limit, lambda article: (article.published_at, article.id))
+    if cursor_after:
+        response.headers[NEXT_CURSOR_HEADER] = cursor_after
+    return articles
+
+def conditional_response(request: Request, response: Response, etag: str, last_modified: Optional[datetime] = None):
+    # Returns a 304 response to send instead of running the query, or None
+    response.headers["ETag"] = etag
+    if last_modified:
+        response.headers["Last-Modified"] = http_date(last_modified)
+    if is_not_modified(request.headers, etag, last_modified):
+        return Response(status_code=304, headers=dict(response.headers))
+    return None
+
+def cached_response(db: Session, request: Request, response: Response, key, compute):
+    # One primary-key read validates both the client's copy and the cached one
+    generation, modified_at = get_ingest_state(db)
+    not_modified = conditional_response(request, response, make_etag(key, generation), modified_at)
+    if not_modified:
+        return not_modified
+
+    # Serializing a page of articles costs more than querying it, so the rendered JSON is cached
+    entry = response_cache.get(key, generation)
+    if entry is None:
+        content = JSONResponse(jsonable_encoder(compute())).body
+        headers = {name: value for name, value in response.headers.items() if name in CACHED_HEADERS}
+        entry = (content, headers)
+        response_cache.set(key, generation, entry)
+    content, headers = entry
+    return Response(content=content, media_type="application/json", headers={**headers, **response.headers})
+
+def rows_response(request: Request, response: Response, key, rows, model):
+    # Sources and posts are edited in place (renames, is_active toggles, post status) with no
+    # modification time to compare, so the ETag hashes the rows returned and Last-Modified is omitted
+    content = JSONResponse(jsonable_encoder([{name: getattr(row, name) for name in model.model_fields} for row in rows])).body
+    not_modified = conditional_response(request, response, make_etag(key, content))
+    if not_modified:
+        return not_modified
+    return Response(content=content, media_type="application/json", headers=dict(response.headers))
+
+ARTICLE_FIELDS = list(ArticleResponse.model_fields)
+# view=summary: everything a list row renders, without the content column
+ARTICLE_SUMMARY_FIELDS = ["id", "source_id", "title", "url", "published_at", "crawled_at", "summary"]
+
+def select_fields(fields: Optional[str], view: Optional[str], allowed: List[str], summary_fields: List[str]) -> List[str]:
+    """Response fields for a fields=a,b,c projection or a view=summary|full request"""
+    if view not in (None, "full", "summary"):
+        raise HTTPException(status_code=400, detail=f"Invalid view: {view}")
+    if not fields:
+        return summary_fields if view == "summary" else allowed
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in allowed]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    # id is always returned so clients can key rows
+    return ["id"] + [name for name in dict.fromkeys(requested) if name != "id"]
+
+def load_article_columns(fields: List[str]):
+    # Only the requested columns are selected; content is never read unless asked for
+    columns = {"id", "published_at"} | {name for name in fields if name in Article.__table__.columns}
+    return load_only(*(getattr(Article, name) for name in sorted(columns)))
+
+def article_dict(article: Article, fields: Optional[List[str]] = None) -> Dict:
+    return {name: getattr(article, name) for name in (fields or ARTICLE_FIELDS)}
+
+# Handlers that use the database are plain `def`: FastAPI runs them in its threadpool,
+# so a slow query never blocks the event loop for every other request
 def get_db():
     db = SessionLocal()
     try:
@@ -153,41 +512,87 @@ async def root():
     }
 
 @app.get("/sources", response_model=List[SourceResponse])
-async def get_sources(db: Session = Depends(get_db)):
+def get_sources(request: Request, response: Response, db: Session = Depends(get_db)):
     sources = db.query(Source).all()
-    return sources
+    return rows_response(request, response, "sources", sources, SourceResponse)
+
+@app.get("/sources/fetch-stats")
+def get_source_fetch_stats(db: Session = Depends(get_db)):
+    # How often feeds answered 304 Not Modified (no download, parse or scoring)
+    sources = db.query(Source).order_by(Source.id).all()
+    fetches = sum(source.fetch_count or 0 for source in sources)
+    not_modified = sum(source.not_modified_count or 0 for source in sources)
+    return {
+        "fetches": fetches,
+        "not_modified": not_modified,
+        "not_modified_rate": round(not_modified / fetches, 4) if fetches else 0.0,
+        "sources": [{
+            "id": source.id,
+            "name": source.name,
+            "fetches": source.fetch_count or 0,
+            "not_modified": source.not_modified_count or 0,
+            "has_validators": bool(source.etag or source.last_modified),
+            "last_fetched_at": source.last_fetched_at,
+        } for source in sources],
+    }
 
 @app.post("/sources", response_model=SourceResponse)
-async def create_source(source: SourceCreate, db: Session = Depends(get_db)):
+def create_source(source: SourceCreate, db: Session = Depends(get_db)):
     db_source = Source(**source.dict())
     db.add(db_source)
+    bump_ingest_generation(db)
     db.commit()
     db.refresh(db_source)
     return db_source
 
 @app.get("/articles", response_model=List[ArticleResponse])
-async def get_articles(source_id: Optional[int] = None, limit: int = 50, offset: int = 0, db: Session = Depends(get_db)):
-    query = db.query(Article)
-    if source_id:
-        query = query.filter(Article.source_id == source_id)
-    articles = query.order_by(Article.published_at.desc()).offset(offset).limit(limit).all()
-    return articles
+def get_articles(request: Request, response: Response, source_id: Optional[int] = None, limit: int = 50, offset: int = 0, cursor: Optional[str] = None, fields: Optional[str] = None, view: Optional[str] = None, db: Session = Depends(get_db)):
+    selected = select_fields(fields, view, ARTICLE_FIELDS, ARTICLE_SUMMARY_FIELDS)
+    def compute():
+        query = db.query(Article).options(load_article_columns(selected))
+        if source_id:
+            query = query.filter(Article.source_id == source_id)
+        return [article_dict(article, selected) for article in paginate_articles(query, response, limit, offset, cursor)]
+    return cached_response(db, request, response, ("articles", source_id, limit, offset, cursor, tuple(selected)), compute)
+
+@app.get("/search", response_model=List[SearchResultResponse])
+def search_articles(request: Request, response: Response, q: str, source_id: Optional[int] = None, limit: int = 50, offset: int = 0, cursor: Optional[str] = None, db: Session = Depends(get_db)):
+    return cached_response(db, request, response, ("search", q, source_id, limit, offset, cursor),
+                           lambda: run_search(db, response, q, source_id, limit, offset, cursor))
 
-@app.get("/search", response_model=List[ArticleResponse])
-async def search_articles(q: str, source_id: Optional[int] = None, limit: int = 50, offset: int = 0, db: Session = Depends(get_db)):
-    query = db.query(Article)
+def run_search(db: Session, response: Response, q: str, source_id: Optional[int], limit: int, offset: int, cursor: Optional[str]):
+    if not FULLTEXT_BACKEND or not query_terms(q):
+        query = db.query(Article)
+        if source_id:
+            query = query.filter(Article.source_id == source_id)
+        query = query.filter((Article.title.like(f"%{q}%")) | (Article.content.like(f"%{q}%")))
+        return [article_dict(article) for article in paginate_articles(query, response, limit, offset, cursor)]
+
+    # Rank-ordered full-text search (see fulltext.py); the cursor is (relevance, id)
+    match, relevance, snippet, fts_table = search_columns(q)
+    query = db.query(Article, relevance.label("relevance"), snippet.label("snippet"))
+    query = query.join(fts_table, fts_table.c.rowid == Article.id)
+    query = query.filter(match)
     if source_id:
         query = query.filter(Article.source_id == source_id)
-    articles = query.filter((Article.title.like(f"%{q}%")) | (Article.content.like(f"%{q}%"))).order_by(Article.published_at.desc()).offset(offset).limit(limit).all()
-    return articles
+    query = query.order_by(relevance.desc(), Article.id.desc())
+    if cursor:
+        query = query.filter(after_cursor((relevance, Article.id), parse_cursor(cursor, (float, int))))
+    else:
+        query = query.offset(offset)
+    rows = query.limit(limit).all()
+    cursor_after = next_cursor(rows, limit, lambda row: (row.relevance, row.Article.id))
+    if cursor_after:
+        response.headers[NEXT_CURSOR_HEADER] = cursor_after
+    return [{**article_dict(row.Article), "snippet": row.snippet, "relevance": row.relevance} for row in rows]
 
 @app.get("/filters", response_model=List[FilterResponse])
-async def get_filters(db: Session = Depends(get_db)):
+def get_filters(db: Session = Depends(get_db)):
     filters = db.query(Filter).all()
     return filters
 
 @app.post("/filters", response_model=FilterResponse)
-async def create_filter(filter: FilterCreate, db: Session = Depends(get_db)):
+def create_filter(filter: FilterCreate, db: Session = Depends(get_db)):
     db_filter = Filter(**filter.dict())
     db.add(db_filter)
     db.commit()
@@ -195,18 +600,25 @@ async def create_filter(filter: FilterCreate, db: Session = Depends(get_db)):
     return db_filter
 
 @app.get("/posts", response_model=List[PostResponse])
-async def get_posts(db: Session = Depends(get_db)):
+def get_posts(request: Request, response: Response, db: Session = Depends(get_db)):
     posts = db.query(Post).all()
-    return posts
+    return rows_response(request, response, "posts", posts, PostResponse)
 
 @app.post("/posts", response_model=PostResponse)
-async def create_post(post: PostCreate, db: Session = Depends(get_db)):
+def create_post(post: PostCreate, db: Session = Depends(get_db)):
     db_post = Post(**post.dict())
     db.add(db_post)
     db.commit()
     db.refresh(db_post)
     return db_post
 
+# Most stored score rows one /haryana/articles request scans to fill its page
+HARYANA_SCAN_BUDGET = 2000
+
+HARYANA_SCORE_FIELDS = ["relevance_score", "matched_keywords", "sentiment", "positive_matches", "negative_matches", "category"]
+HARYANA_ARTICLE_FIELDS = ARTICLE_FIELDS + HARYANA_SCORE_FIELDS
+HARYANA_SUMMARY_FIELDS = ARTICLE_SUMMARY_FIELDS + ["relevance_score", "sentiment", "category"]
+
 if HARYANA_CONFIG_AVAILABLE:
     @app.get("/haryana/filter-presets")
     async def get_haryana_filter_presets():
@@ -216,83 +628,120 @@ if HARYANA_CONFIG_AVAILABLE:
         return presets
 
     @app.get("/haryana/articles")
-    async def get_haryana_articles(filter_preset: Optional[str] = None, source_id: Optional[int] = None, sentiment: Optional[str] = None, min_score: int = 0, limit: int = 100, offset: int = 0, db: Session = Depends(get_db)):
+    def get_haryana_articles(request: Request, response: Response, filter_preset: Optional[str] = None, source_id: Optional[int] = None, sentiment: Optional[str] = None, min_score: int = 0, limit: int = 100, offset: int = 0, cursor: Optional[str] = None, max_scan: int = HARYANA_SCAN_BUDGET, fields: Optional[str] = None, view: Optional[str] = None, db: Session = Depends(get_db)):
         # If filter_preset is provided, validate it
         if filter_preset and filter_preset not in HARYANA_FILTER_PRESETS:
             raise HTTPException(status_code=400, detail=f"Invalid filter preset: {filter_preset}")
         
-        query = db.query(Article)
+        selected = select_fields(fields, view, HARYANA_ARTICLE_FIELDS, HARYANA_SUMMARY_FIELDS)
+        key = ("haryana_articles", filter_preset, source_id, sentiment, min_score, limit, offset, cursor, max_scan, tuple(selected))
+        return cached_response(db, request, response, key, lambda: scan_haryana_articles(
+            db, response, filter_preset, source_id, sentiment, min_score, limit, offset, cursor, max_scan, selected
+        ))
+    
+    def scan_haryana_articles(db: Session, response: Response, filter_preset: Optional[str], source_id: Optional[int], sentiment: Optional[str], min_score: int, limit: int, offset: int, cursor: Optional[str], max_scan: int, fields: List[str]):
+        # Scores are computed at ingest (see article_scores.py), so this is a single indexed query
+        config_hash = scoring_fingerprint()
+        query = db.query(ArticleScore, Article).join(Article, Article.id == ArticleScore.article_id).options(load_article_columns(fields))
+        if filter_preset:
+            query = query.filter(ArticleScore.preset == filter_preset)
+        else:
+            # Best-scoring category per article
+            query = query.filter(ArticleScore.is_best == True)
         if source_id:
             query = query.filter(Article.source_id == source_id)
-        articles = query.order_by(Article.published_at.desc()).limit(limit * 3).all()
+        # Relevance, score and sentiment filters only apply to rows scored under the live config;
+        # stale rows are rescored below and filtered on their fresh values
+        stored_filters = [ArticleScore.is_relevant == True, ArticleScore.score >= min_score]
+        if sentiment:
+            stored_filters.append(ArticleScore.sentiment == sentiment)
+        # Written as ranges so the config_hash index answers the probe
+        stale = or_(ArticleScore.config_hash < config_hash, ArticleScore.config_hash > config_hash, ArticleScore.config_hash.is_(None))
+        if db.query(ArticleScore.id).filter(stale).first() is not None:
+            query = query.filter(or_(stale, and_(*stored_filters)))
+        else:
+            # Nothing stale (the usual case): keep the score range on the (preset, score) index
+            query = query.filter(*stored_filters)
+        # Cursor is the stored sort key of the last scanned row: (score, published_at, article id);
+        # stale rows keep their stored position until the rescore job reaches them
+        sort_key = (ArticleScore.score, Article.published_at, Article.id)
+        row_key = lambda row: (row[0].score, row[1].published_at, row[1].id)
+        query = query.order_by(*(column.desc() for column in sort_key))
+        if cursor:
+            first_batch = query.filter(after_cursor(sort_key, parse_cursor(cursor, (float, datetime, int))))
+        else:
+            first_batch = query.offset(offset)
 
+        # Stale rows rescored on the fly can drop out of the filters, so scan in batches
+        # until the page is full, the scan budget is spent or there are no more rows
         scored_articles = []
+        scanned = 0
+        exhausted = False
+        last_row = None
+        while len(scored_articles) < limit and scanned < max_scan and not exhausted:
+            batch_size = min(limit - len(scored_articles), max_scan - scanned)
+            batch = first_batch if last_row is None else query.filter(after_cursor(sort_key, row_key(last_row)))
+            rows = batch.limit(batch_size).all()
+            scanned += len(rows)
+            exhausted = len(rows) < batch_size
+            if rows:
+                last_row = rows[-1]
+
+            # Scored under an older config and not yet reached by the rescore job: fetch the text
+            # of every such row in one query (the projection may have left it out) and rescore
+            stale_ids = [article.id for score, article in rows if score.config_hash != config_hash]
+            stale_texts = {
+                article_id: f"{title} {content}"
+                for article_id, title, content in db.query(Article.id, Article.title, Article.content).filter(Article.id.in_(stale_ids))
+            } if stale_ids else {}
+
+            for score, article in rows:
+                category = score.preset
+                result = {"score": score.score, "matched_keywords": score.matched_keywords or [], "sentiment": score.sentiment, "positive_matches": score.positive_matches or [], "negative_matches": score.negative_matches or []}
+                if article.id in stale_texts:
+                    analyzed = analyze_text(stale_texts[article.id])
+                    if not is_haryana_relevant(analyzed):
+                        continue
+                    all_scores = score_all_presets(analyzed)
+                    category = filter_preset or all_scores["best_preset"]
+                    result = all_scores["results"][category]
+                    if result["score"] < min_score or (sentiment and result["sentiment"] != sentiment):
+                        continue
+                scored_articles.append((result["score"], haryana_article_response(article, result, category, fields)))
+
+        response.headers[SCANNED_HEADER] = str(scanned)
+        response.headers[EXHAUSTED_HEADER] = "true" if exhausted else "false"
+        if last_row is not None and not exhausted:
+            response.headers[NEXT_CURSOR_HEADER] = encode_cursor(*row_key(last_row))
         
-        for article in articles:
-            article_text = f"{article.title} {article.content}"
-            if not is_haryana_relevant(article_text):
-                continue
-            
-            # If filter_preset is provided, use it; otherwise score against all categories and use best
-            if filter_preset:
-                result = calculate_relevance_score(article_text, filter_preset)
-                relevance_score = result.get("score", result.get("relevance_score", 0))
-                best_category = filter_preset
-                matched_keywords = result.get("matched_keywords", [])
-                article_sentiment = result.get("sentiment", "neutral")
-                positive_matches = result.get("positive_matches", [])
-                negative_matches = result.get("negative_matches", [])
-            else:
-                # Score against all categories and use the best score
-                best_score = -float('inf')
-                best_result = None
-                best_category = None
-                
-                for category_key in HARYANA_FILTER_PRESETS.keys():
-                    result = calculate_relevance_score(article_text, category_key)
-                    score = result.get("score", result.get("relevance_score", 0))
-                    if score > best_score:
-                        best_score = score
-                        best_result = result
-                        best_category = category_key
-                
-                if best_result is None or best_score < min_score:
-                    continue
-                
-                relevance_score = best_score
-                matched_keywords = best_result.get("matched_keywords", [])
-                article_sentiment = best_result.get("sentiment", "neutral")
-                positive_matches = best_result.get("positive_matches", [])
-                negative_matches = best_result.get("negative_matches", [])
-
-            if relevance_score < min_score:
-                continue
-            if sentiment and article_sentiment != sentiment:
-                continue
-            
-            article_dict = {
-                "id": article.id,
-                "source_id": article.source_id,
-                "title": article.title,
-                "content": article.content,
-                "url": article.url,
-                "published_at": article.published_at.isoformat(),
-                "crawled_at": article.crawled_at.isoformat(),
-                "relevance_score": relevance_score,
-                "matched_keywords": matched_keywords,
-                "sentiment": article_sentiment,
-                "positive_matches": positive_matches,
-                "negative_matches": negative_matches,
-                "category": best_category  # Add category info
-            }
-            scored_articles.append(article_dict)
-        
-        # Sort by score descending (high to low)
-        scored_articles.sort(key=lambda x: x["relevance_score"], reverse=True)
-        return scored_articles[:limit]
+        # Rescored stale rows may have moved within the page
+        scored_articles.sort(key=lambda x: x[0], reverse=True)
+        return [article for _, article in scored_articles]
+    
+    def haryana_article_response(article, result, category, fields):
+        values = {
+            "relevance_score": result["score"],
+            "matched_keywords": result.get("matched_keywords", []),
+            "sentiment": result.get("sentiment", "neutral"),
+            "positive_matches": result.get("positive_matches", []),
+            "negative_matches": result.get("negative_matches", []),
+            "category": category  # Add category info
+        }
+        return {name: values[name] if name in values else getattr(article, name) for name in fields}
+    
+    @app.get("/haryana/rescore/status")
+    def get_haryana_rescore_status(db: Session = Depends(get_db)):
+        from rescore_job import get_rescore_progress
+        return get_rescore_progress(db)
+    
+    @app.post("/haryana/rescore")
+    async def trigger_haryana_rescore(background_tasks: BackgroundTasks, chunk_size: int = 500):
+        from rescore_job import rescore_stale_articles
+        background_tasks.add_task(rescore_stale_articles, chunk_size=chunk_size)
+        return {"success": True, "message": "Rescoring of stale articles started", "config_hash": scoring_fingerprint()}
     
     @app.get("/haryana/articles/{article_id}/analyze")
-    async def analyze_haryana_article(article_id: int, filter_preset: str, db: Session = Depends(get_db)):
+    def analyze_haryana_article(article_id: int, filter_preset: str, db: Session = Depends(get_db)):
         article = db.query(Article).filter(Article.id == article_id).first()
         if not article:
             raise HTTPException(status_code=404, detail="Article not found")
@@ -308,7 +757,7 @@ if TWITTER_AVAILABLE:
         return twitter_service.get_status()
     
     @app.post("/twitter/post")
-    async def post_to_twitter(request: TweetRequest, db: Session = Depends(get_db)):
+    def post_to_twitter(request: TweetRequest, db: Session = Depends(get_db)):
         article = db.query(Article).filter(Article.id == request.article_id).first()
         if not article:
             raise HTTPException(status_code=404, detail="Article not found")
@@ -325,7 +774,7 @@ if TWITTER_AVAILABLE:
             raise HTTPException(status_code=500, detail=result.get('error', 'Failed to post tweet'))
     
     @app.post("/twitter/preview")
-    async def preview_tweet(request: TweetRequest, db: Session = Depends(get_db)):
+    def preview_tweet(request: TweetRequest, db: Session = Depends(get_db)):
         article = db.query(Article).filter(Article.id == request.article_id).first()
         if not article:
             raise HTTPException(status_code=404, detail="Article not found")
@@ -334,32 +783,57 @@ if TWITTER_AVAILABLE:
         tweet_text = twitter_service.create_engaging_tweet(article=article_dict, custom_message=request.custom_message, include_hashtags=request.include_hashtags, max_length=max_length, use_premium=request.use_premium)
         return {'tweet_text': tweet_text, 'character_count': len(tweet_text), 'article': {'id': article.id, 'title': article.title, 'url': article.url}}
 
+@app.get("/cache/stats")
+async def get_cache_stats():
+    return response_cache.stats()
+
+@app.get("/stream/articles")
+async def stream_articles(filter_preset: Optional[str] = None, min_score: float = 0):
+    # Server-Sent Events: one "article" event per newly saved article passing the filters
+    if filter_preset and not (HARYANA_CONFIG_AVAILABLE and filter_preset in HARYANA_FILTER_PRESETS):
+        raise HTTPException(status_code=400, detail=f"Invalid filter preset: {filter_preset}")
+    subscription = article_broker.subscribe(filter_preset, min_score)
+    return StreamingResponse(
+        stream_events(subscription),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@app.get("/stream/stats")
+async def get_stream_stats():
+    return article_broker.stats()
+
 @app.post("/scrape/trigger")
-async def trigger_manual_scrape():
+def trigger_manual_scrape():
+    # Returns at once; the scrape runs in a background worker (see scrape_jobs.py)
+    from scrape_jobs import start_scrape_job
     try:
-        import sys
-        import os
-        sys.path.append(os.path.dirname(__file__))
-        sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-        from auto_scrape import auto_scrape
-        results = auto_scrape(verbose=False)
-        return {"success": True, "message": "Scraping completed successfully", "results": {"sources_scraped": results.get('sources_scraped', 0), "articles_found": results.get('articles_found', 0), "new_articles": results.get('new_articles', 0), "errors": results.get('errors', [])}}
+        job, created = start_scrape_job()
     except Exception as e:
-        import traceback
-        error_detail = traceback.format_exc()
-        print(f"Error during manual scrape: {error_detail}")
         raise HTTPException(status_code=500, detail=f"Failed to trigger scraping: {str(e)}")
+    message = "Scraping started" if created else "A scrape is already running"
+    return {"success": True, "message": message, "job_id": job["id"], "already_running": not created, "job": job}
+
+@app.get("/scrape/jobs/{job_id}")
+def get_scrape_job(job_id: int, db: Session = Depends(get_db)):
+    from scrape_jobs import job_dict
+    job = db.get(ScrapeJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Scrape job not found")
+    return job_dict(job)
 
 @app.get("/scrape/status")
-async def get_scrape_status(db: Session = Depends(get_db)):
+def get_scrape_status(request: Request, response: Response, exact: bool = False, db: Session = Depends(get_db)):
+    from ingest_stats import exact_ingest_stats, read_ingest_stats
     try:
-        total_articles = db.query(Article).count()
-        yesterday = datetime.utcnow() - timedelta(days=1)
-        recent_articles = db.query(Article).filter(Article.crawled_at >= yesterday).count()
-        last_hour = datetime.utcnow() - timedelta(hours=1)
-        last_hour_articles = db.query(Article).filter(Article.crawled_at >= last_hour).count()
-        latest_article = db.query(Article).order_by(Article.crawled_at.desc()).first()
-        return {"total_articles": total_articles, "last_24h": recent_articles, "last_hour": last_hour_articles, "latest_article": {"title": latest_article.title if latest_article else None, "crawled_at": latest_article.crawled_at.isoformat() if latest_article else None} if latest_article else None, "active_sources": db.query(Source).filter(Source.is_active == True).count()}
+        # The 24h/1h windows move with the clock, so the validator includes the current minute
+        generation, _ = get_ingest_state(db)
+        etag = make_etag("scrape_status", generation, exact, datetime.utcnow().strftime("%Y%m%d%H%M"))
+        not_modified = conditional_response(request, response, etag)
+        if not_modified:
+            return not_modified
+        # Stats row maintained at ingest; exact=1 aggregates the articles table instead
+        return exact_ingest_stats(db) if exact else read_ingest_stats(db)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get scrape status: {str(e)}")
 
@@ -0,0 +1,159 @@
+"""
+Incremental rescoring of stale article scores
+Every ArticleScore row is stamped with the scoring-config fingerprint. After
+HARYANA_FILTER_PRESETS, HARYANA_LOCATIONS or SENTIMENT_WEIGHTS change, this job
+rescores only the articles whose rows carry an older stamp, in bounded chunks,
+checkpointing after each chunk so an interrupted run resumes where it stopped.
+"""
+
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from main import Article, ArticleScore, RescoreCheckpoint, SessionLocal
+from haryana_config import scoring_fingerprint
+from bulk_scoring import TermMatrixScorer, rescore_batch
+
+logger = logging.getLogger(__name__)
+
+# Only one rescoring run per process
+_run_lock = threading.Lock()
+
+
+def stale_articles_query(db: Session, config_hash: str):
+    """Articles without scores stamped with config_hash"""
+    fresh_ids = db.query(ArticleScore.article_id).filter(ArticleScore.config_hash == config_hash)
+    return db.query(Article).filter(~Article.id.in_(fresh_ids))
+
+
+def get_rescore_progress(db: Session) -> Dict:
+    """Progress of the rescoring run for the current scoring configuration"""
+    config_hash = scoring_fingerprint()
+    checkpoint = db.query(RescoreCheckpoint).filter(RescoreCheckpoint.config_hash == config_hash).first()
+    stale_remaining = stale_articles_query(db, config_hash).count()
+
+    if not checkpoint:
+        return {
+            "config_hash": config_hash,
+            "status": "idle" if stale_remaining else "up_to_date",
+            "stale_remaining": stale_remaining,
+            "running": _run_lock.locked(),
+        }
+
+    return {
+        "config_hash": config_hash,
+        "status": checkpoint.status,
+        "stale_total": checkpoint.stale_total,
+        "rescored": checkpoint.rescored_count,
+        "stale_remaining": stale_remaining,
+        "progress": round(checkpoint.rescored_count / checkpoint.stale_total, 4) if checkpoint.stale_total else 1.0,
+        "last_article_id": checkpoint.last_article_id,
+        "error": checkpoint.error,
+        "started_at": checkpoint.started_at.isoformat() if checkpoint.started_at else None,
+        "updated_at": checkpoint.updated_at.isoformat() if checkpoint.updated_at else None,
+        "finished_at": checkpoint.finished_at.isoformat() if checkpoint.finished_at else None,
+        "running": _run_lock.locked(),
+    }
+
+
+def rescore_stale_articles(chunk_size: int = 500, max_chunks: Optional[int] = None) -> Dict:
+    """
+    Rescore articles whose stored scores were computed under another configuration
+
+    Args:
+        chunk_size: Articles rescored and committed per chunk
+        max_chunks: Stop after this many chunks (None = until done); the
+            checkpoint lets a later call continue
+
+    Returns:
+        dict with the run summary
+    """
+    if not _run_lock.acquire(blocking=False):
+        return {"success": False, "message": "Rescoring already running"}
+
+    db = SessionLocal()
+    config_hash = scoring_fingerprint()
+    scorer = TermMatrixScorer()
+    rescored_this_run = 0
+    checkpoint = None
+
+    try:
+        checkpoint = db.query(RescoreCheckpoint).filter(RescoreCheckpoint.config_hash == config_hash).first()
+        if not checkpoint or checkpoint.status == "completed":
+            # New configuration, or new stale rows since the last completed run
+            stale_total = stale_articles_query(db, config_hash).count()
+            if not checkpoint:
+                checkpoint = RescoreCheckpoint(config_hash=config_hash)
+                db.add(checkpoint)
+            checkpoint.last_article_id = 0
+            checkpoint.rescored_count = 0
+            checkpoint.stale_total = stale_total
+            checkpoint.started_at = datetime.utcnow()
+            checkpoint.finished_at = None
+        checkpoint.status = "running"
+        checkpoint.error = None
+        checkpoint.updated_at = datetime.utcnow()
+        db.commit()
+
+        chunks = 0
+        while max_chunks is None or chunks < max_chunks:
+            articles = stale_articles_query(db, config_hash).with_entities(
+                Article.id, Article.title, Article.content
+            ).filter(
+                Article.id > checkpoint.last_article_id
+            ).order_by(Article.id).limit(chunk_size).all()
+
+            if not articles:
+                checkpoint.status = "completed"
+                checkpoint.finished_at = datetime.utcnow()
+                break
+
+            rescore_batch(db, articles, scorer)
+            checkpoint.last_article_id = articles[-1].id
+            checkpoint.rescored_count += len(articles)
+            checkpoint.updated_at = datetime.utcnow()
+            db.commit()
+
+            chunks += 1
+            rescored_this_run += len(articles)
+            logger.info(f"Rescored {checkpoint.rescored_count}/{checkpoint.stale_total} stale articles")
+        else:
+            checkpoint.status = "paused"
+
+        checkpoint.updated_at = datetime.utcnow()
+        db.commit()
+
+        return {
+            "success": True,
+            "config_hash": config_hash,
+            "status": checkpoint.status,
+            "rescored": rescored_this_run,
+        }
+
+    except Exception as e:
+        logger.error(f"Error rescoring stale articles: {str(e)}")
+        db.rollback()
+        if checkpoint is not None and checkpoint.id is not None:
+            checkpoint.status = "failed"
+            checkpoint.error = str(e)
+            checkpoint.updated_at = datetime.utcnow()
+            db.commit()
+        return {"success": False, "config_hash": config_hash, "message": str(e), "rescored": rescored_this_run}
+    finally:
+        db.close()
+        _run_lock.release()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Rescore articles whose scores are stale')
+    parser.add_argument('--chunk-size', type=int, default=500, help='Articles per committed chunk (default: 500)')
+    parser.add_argument('--max-chunks', type=int, default=None, help='Stop after N chunks; rerun to resume')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    print(rescore_stale_articles(chunk_size=args.chunk_size, max_chunks=args.max_chunks))
@@ -0,0 +1,72 @@
+"""
+In-process response cache for the article list endpoints
+Entries are keyed by endpoint and query parameters and tagged with the ingest
+generation they were computed under. Anything that writes articles or scores
+bumps the generation (main.bump_ingest_generation) in the same transaction, so
+a stale entry is simply never matched again; the TTL is a backstop for writes
+made outside the application.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class ResponseCache:
+    """Thread-safe LRU cache with a TTL and generation-tagged entries"""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300):
+        """
+        Args:
+            maxsize: Most entries kept; the least recently used is evicted first
+            ttl: Seconds an entry is served for, whatever the generation
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, generation: int) -> Optional[Any]:
+        """Cached value for key if it was stored under generation and has not expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            entry_generation, stored_at, value = entry
+            if entry_generation != generation or time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, generation: int, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (generation, time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+            }
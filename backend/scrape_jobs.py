@@ -0,0 +1,131 @@
+"""
+Background scrape jobs for /scrape/trigger
+A manual scrape fetches every active feed and can take minutes, longer than
+proxies and the GitHub Actions curl will hold a request open. The trigger
+endpoint records a ScrapeJob and returns its id at once; a worker thread runs
+auto_scrape and writes per-source progress to the job row, which clients poll
+at /scrape/jobs/{id}. Only one job runs at a time: triggering while one is
+queued or running returns the existing job.
+"""
+
+import logging
+import os
+import sys
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Tuple
+
+from main import ScrapeJob, SessionLocal, Source
+
+logger = logging.getLogger(__name__)
+
+# A running job with no progress for this long is assumed lost (e.g. the server restarted)
+JOB_STALE_AFTER = timedelta(minutes=30)
+
+ACTIVE_STATUSES = ("queued", "running")
+
+_start_lock = threading.Lock()
+
+
+def job_dict(job: ScrapeJob) -> Dict:
+    """API representation of a job; results matches the old synchronous trigger response"""
+    errors = job.errors or []
+    return {
+        "id": job.id,
+        "status": job.status,
+        "sources_total": job.sources_total,
+        "sources_done": job.sources_done,
+        "articles_found": job.articles_found,
+        "new_articles": job.new_articles,
+        "sources": job.sources or [],
+        "errors": errors,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "updated_at": job.updated_at,
+        "finished_at": job.finished_at,
+        "results": {
+            "sources_scraped": job.sources_done,
+            "articles_found": job.articles_found,
+            "new_articles": job.new_articles,
+            "errors": errors,
+        },
+    }
+
+
+def start_scrape_job() -> Tuple[Dict, bool]:
+    """
+    Queue a scrape and start its worker, unless one is already active
+
+    Returns:
+        (job dict, created) - created is False when an active job was returned instead
+    """
+    with _start_lock:
+        db = SessionLocal()
+        try:
+            now = datetime.utcnow()
+            stale = db.query(ScrapeJob).filter(
+                ScrapeJob.status.in_(ACTIVE_STATUSES),
+                ScrapeJob.updated_at < now - JOB_STALE_AFTER,
+            ).all()
+            for job in stale:
+                job.status = "failed"
+                job.errors = (job.errors or []) + ["Job stopped reporting progress"]
+                job.finished_at = now
+            db.commit()
+
+            active = db.query(ScrapeJob).filter(
+                ScrapeJob.status.in_(ACTIVE_STATUSES)
+            ).order_by(ScrapeJob.id.desc()).first()
+            if active:
+                return job_dict(active), False
+
+            job = ScrapeJob(status="queued", sources=[], errors=[])
+            db.add(job)
+            db.commit()
+            worker = threading.Thread(target=run_scrape_job, args=(job.id,), daemon=True)
+            worker.start()
+            return job_dict(job), True
+        finally:
+            db.close()
+
+
+def run_scrape_job(job_id: int) -> None:
+    """Run auto_scrape for a queued job, committing progress after each source"""
+    db = SessionLocal()
+    try:
+        job = db.get(ScrapeJob, job_id)
+        job.status = "running"
+        job.started_at = job.updated_at = datetime.utcnow()
+        job.sources_total = db.query(Source).filter(Source.is_active == True, Source.rss_feed != None, Source.rss_feed != "").count()
+        db.commit()
+
+        sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        from auto_scrape import auto_scrape
+
+        def record_progress(source_progress):
+            # JSON columns only persist on reassignment
+            job.sources = (job.sources or []) + [source_progress]
+            job.sources_done += 1
+            job.articles_found += source_progress["articles_found"]
+            job.new_articles += source_progress["new_articles"]
+            job.updated_at = datetime.utcnow()
+            db.commit()
+
+        results = auto_scrape(verbose=False, progress=record_progress)
+
+        job.status = "completed"
+        job.errors = results.get("errors", [])
+        job.finished_at = job.updated_at = datetime.utcnow()
+        db.commit()
+        logger.info(f"Scrape job {job_id} completed: {job.new_articles} new articles")
+    except Exception as e:
+        logger.exception(f"Scrape job {job_id} failed")
+        db.rollback()
+        job = db.get(ScrapeJob, job_id)
+        if job:
+            job.status = "failed"
+            job.errors = (job.errors or []) + [f"Fatal error during scraping: {str(e)}"]
+            job.finished_at = job.updated_at = datetime.utcnow()
+            db.commit()
+    finally:
+        db.close()
@@ -3,17 +3,25 @@ import requests
 from bs4 import BeautifulSoup
 from sqlalchemy.orm import Session
 from datetime import datetime
-import time
 import logging
-from typing import List, Dict
+from typing import List, Dict, Optional, Union
+from collections import Counter
 import re
 
-from main import Article, Source, SessionLocal
+from sqlalchemy import insert
+from main import Article, ArticleScore, ArticleTerm, Source, SessionLocal, bump_ingest_generation, dialect_insert, make_summary
+from article_scores import score_mappings
+from term_index import posting_mappings
+from ingest_stats import record_ingest
+from article_stream import article_broker, article_event
+from feed_fetcher import FeedFetcher, FeedResponse
+from known_urls import known_urls
+from url_canonical import url_hash
 from haryana_config import (
-    HARYANA_FILTER_PRESETS,
-    HARYANA_LOCATIONS,
-    calculate_relevance_score,
+    AnalyzedText,
+    analyze_text,
     is_haryana_relevant,
+    score_all_presets,
 )
 
 logging.basicConfig(level=logging.INFO)
@@ -100,12 +108,77 @@ class NewsScraper:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        self.feed_fetcher = FeedFetcher(headers=self.session.headers)
+    
+    def fetch_feeds(self, sources: List[Source]):
+        """Download the sources' RSS feeds concurrently, yielding (source, FeedResponse) as each completes"""
+        return self.feed_fetcher.fetch_all(
+            (source, source.rss_feed, source.etag, source.last_modified) for source in sources if source.rss_feed
+        )
+    
+    def record_fetch(self, db: Session, source: Source, feed_response: FeedResponse):
+        """
+        Store a feed's validators and 304 counts (call after its articles are saved)
+
+        Args:
+            db: Session the source was loaded in; committed here
+            source: Source whose feed was fetched
+            feed_response: Result of fetch_feeds for the source
+        """
+        if not feed_response.ok:
+            return
+        source.last_fetched_at = datetime.utcnow()
+        source.fetch_count = (source.fetch_count or 0) + 1
+        if feed_response.not_modified:
+            source.not_modified_count = (source.not_modified_count or 0) + 1
+        else:
+            source.etag = feed_response.headers.get('etag')
+            source.last_modified = feed_response.headers.get('last-modified')
+        db.commit()
     
     def scrape_rss_feed(self, rss_url: str, source_id: int) -> List[Dict]:
-        """Scrape articles from an RSS feed"""
+        """Scrape articles from an RSS feed (errors are logged and give an empty list)"""
+        try:
+            return self.parse_feed(self.feed_fetcher.fetch(rss_url), source_id)
+        except Exception:
+            return []
+    
+    def parse_feed(self, feed_response: FeedResponse, source_id: int) -> List[Dict]:
+        """
+        Top positive articles from a downloaded RSS feed
+        
+        Raises:
+            RuntimeError: The download failed
+            ValueError: The body could not be read as a feed (or any other parse error)
+        """
+        rss_url = feed_response.url
+        if not feed_response.ok:
+            logger.error(f"Error scraping RSS feed {rss_url}: {feed_response.error}")
+            raise RuntimeError(feed_response.error)
+        if feed_response.not_modified:
+            logger.info(f"RSS feed not modified since last fetch: {rss_url}")
+            return []
         try:
             logger.info(f"Scraping RSS feed: {rss_url}")
-            feed = feedparser.parse(rss_url)
+            feed = feedparser.parse(
+                feed_response.content,
+                # Body is already decompressed, so only the charset hints are passed on
+                response_headers={
+                    'content-type': feed_response.headers.get('content-type', ''),
+                    'content-location': rss_url,
+                },
+            )
+            # bozo is also set for recoverable glitches; fail only if nothing was recognised as a feed
+            if feed.bozo and not feed.entries and not feed.version:
+                raise ValueError(f"Unreadable feed: {feed.get('bozo_exception')}")
+            
+            # The top 3 are picked from every entry, as before; stored ones are dropped after the
+            # cut, and a feed with nothing new is not scored at all
+            links = [entry.get('link', '') for entry in feed.entries]
+            known_links = {link for link, is_known in zip(links, known_urls.contains_many(links)) if is_known}
+            if feed.entries and len(known_links) == len(set(links)):
+                logger.info(f"All {len(feed.entries)} entries from {rss_url} are already stored; skipping.")
+                return []
             
             scored_articles = []
             for entry in feed.entries:
@@ -144,11 +217,14 @@ class NewsScraper:
             
             limited_articles = positive_articles[:3]
             logger.info(f"Limiting to top {len(limited_articles)} positive articles for source {source_id}")
-            return limited_articles
+            new_articles = [article for article in limited_articles if article['url'] not in known_links]
+            if len(new_articles) < len(limited_articles):
+                logger.info(f"Skipping {len(limited_articles) - len(new_articles)} already stored articles from {rss_url}")
+            return new_articles
             
         except Exception as e:
             logger.error(f"Error scraping RSS feed {rss_url}: {str(e)}")
-            return []
+            raise
     
     def _parse_date(self, date_str: str) -> datetime:
         """Parse various date formats from RSS feeds"""
@@ -229,42 +305,94 @@ class NewsScraper:
             return ''
     
     def save_articles(self, articles: List[Dict]) -> int:
-        """Save articles to database"""
+        """
+        Save articles to database; raises if the batch could not be committed
+        
+        Known URLs are found with one IN lookup on url_hash (the hash of the
+        canonical URL, so tracking parameters, AMP paths and the like do not
+        create duplicates) and the new rows go in with one INSERT ... ON
+        CONFLICT DO NOTHING, so a URL saved concurrently by another scraper is
+        skipped instead of failing the whole batch.
+        """
         db = SessionLocal()
         saved_count = 0
+        saved = []
         
         try:
-            for article_data in articles:
-                # Check if article already exists
-                existing = db.query(Article).filter(Article.url == article_data['url']).first()
-                if existing:
+            hashes = [url_hash(article_data['url']) for article_data in articles]
+            seen_hashes = {value for value, in db.query(Article.url_hash).filter(Article.url_hash.in_(set(hashes)))} if hashes else set()
+            
+            candidates = []
+            for article_data, article_hash in zip(articles, hashes):
+                # Skip stored articles and repeats within the batch
+                if article_hash in seen_hashes:
                     continue
+                seen_hashes.add(article_hash)
+                article_data['url_hash'] = article_hash
 
-                # Ensure Haryana relevance (title/content)
-                article_text = f"{article_data.get('title', '')} {article_data.get('content', '')}"
-                if not is_haryana_relevant(article_text):
+                # Ensure Haryana relevance (title/content); the text is analyzed once for every check below
+                analyzed = analyze_text(f"{article_data.get('title', '')} {article_data.get('content', '')}")
+                if not is_haryana_relevant(analyzed):
                     # Try fetching full article content once before skipping
                     full_content = self.scrape_article_content(article_data['url'])
                     if full_content:
                         article_data['content'] = full_content
-                        article_text = f"{article_data.get('title', '')} {full_content}"
-                    if not is_haryana_relevant(article_text):
+                        analyzed = analyze_text(f"{article_data.get('title', '')} {full_content}")
+                    if not is_haryana_relevant(analyzed):
                         continue
                 
-                if not self._is_primary_haryana_story(article_data.get('title', ''), article_text):
+                if not self._is_primary_haryana_story(article_data.get('title', ''), analyzed):
                     continue
                 
-                # Create new article
-                article = Article(**article_data)
-                db.add(article)
-                saved_count += 1
+                candidates.append((article_data, analyzed))
             
+            if candidates:
+                # Core insert: set what the ORM defaults and before_insert hook would have
+                now = datetime.utcnow()
+                rows = [
+                    {**article_data, 'summary': make_summary(article_data.get('content')), 'crawled_at': now}
+                    for article_data, _ in candidates
+                ]
+                # No conflict target: skips rows clashing on either url or url_hash
+                statement = dialect_insert(db)(Article).on_conflict_do_nothing()
+                inserted_ids = {value: article_id for article_id, value in db.execute(statement.returning(Article.id, Article.url_hash), rows)}
+                
+                score_rows = []
+                term_rows = []
+                for row, (_, analyzed) in zip(rows, candidates):
+                    if row['url_hash'] not in inserted_ids:
+                        continue  # Saved by a concurrent scrape since the lookup
+                    article = Article(id=inserted_ids[row['url_hash']], **row)
+                    
+                    # Persist per-preset scores so list endpoints never rescore
+                    all_scores = score_all_presets(analyzed)
+                    article_scores = score_mappings(
+                        article.id, all_scores["results"], all_scores["best_preset"], is_haryana_relevant(analyzed)
+                    )
+                    score_rows.extend(article_scores)
+                    _, _, found_terms = analyzed.scoring_terms
+                    term_rows.extend(posting_mappings(article.id, found_terms))
+                    saved.append((article, article_scores))
+                
+                if score_rows:
+                    db.execute(insert(ArticleScore), score_rows)
+                if term_rows:
+                    db.execute(insert(ArticleTerm), term_rows)
+            
+            if saved:
+                record_ingest(db, [article for article, _ in saved])
+                bump_ingest_generation(db)
             db.commit()
+            # Count and stream the batch only once it is committed
+            saved_count = len(saved)
             logger.info(f"Saved {saved_count} new articles")
+            if article_broker.has_subscribers():
+                article_broker.publish([article_event(article, article_scores) for article, article_scores in saved])
             
         except Exception as e:
             logger.error(f"Error saving articles: {str(e)}")
             db.rollback()
+            raise
         finally:
             db.close()
         
@@ -278,14 +406,15 @@ class NewsScraper:
         try:
             sources = db.query(Source).filter(Source.is_active == True).all()
             
-            for source in sources:
-                if source.rss_feed:
-                    articles = self.scrape_rss_feed(source.rss_feed, source.id)
-                    saved_count = self.save_articles(articles)
-                    total_saved += saved_count
-                    
-                    # Small delay between sources
-                    time.sleep(1)
+            # Feeds download in parallel; each is parsed and saved here as it arrives
+            for source, feed_response in self.fetch_feeds(sources):
+                try:
+                    articles = self.parse_feed(feed_response, source.id)
+                    total_saved += self.save_articles(articles)
+                except Exception:
+                    # Validators stay as they were, so the next run downloads the feed again
+                    continue
+                self.record_fetch(db, source, feed_response)
             
             logger.info(f"Total articles saved: {total_saved}")
             
@@ -296,13 +425,12 @@ class NewsScraper:
         
         return total_saved
 
-    def _calculate_positivity_score(self, title: str, content: str) -> float:
+    def _calculate_positivity_score(self, title: str, content: str, analyzed: Optional[AnalyzedText] = None) -> float:
         """Calculate a positivity-oriented score using all Haryana presets"""
-        article_text = f"{title} {content or ''}"
+        analyzed = analyzed or analyze_text(f"{title} {content or ''}")
         best_positive: tuple[float, dict] | None = None
         
-        for preset_key in HARYANA_FILTER_PRESETS.keys():
-            result = calculate_relevance_score(article_text, preset_key)
+        for result in score_all_presets(analyzed)["results"].values():
             score = result.get('score', 0)
             sentiment = result.get('sentiment')
             
@@ -327,13 +455,13 @@ class NewsScraper:
         if score < 100:
             return float('-inf')
         
-        if not self._has_high_impact_indicator(article_text):
+        if not self._has_high_impact_indicator(analyzed):
             return float('-inf')
         
         return score
 
-    def _has_high_impact_indicator(self, text: str) -> bool:
-        text_lower = text.lower()
+    def _has_high_impact_indicator(self, text: Union[str, AnalyzedText]) -> bool:
+        text_lower = analyze_text(text).lower
         for keyword in self.HIGH_IMPACT_KEYWORDS:
             if keyword in text_lower:
                 return True
@@ -341,24 +469,29 @@ class NewsScraper:
             return True
         return False
 
-    def _is_primary_haryana_story(self, title: str, full_text: str) -> bool:
+    def _is_primary_haryana_story(self, title: str, full_text: Union[str, AnalyzedText]) -> bool:
         """Ensure Haryana mention is central, not incidental"""
-        title_lower = title.lower()
-        text_lower = full_text.lower()
-        location_hits = 0
-        for location in HARYANA_LOCATIONS:
-            loc = location.lower()
-            if loc in title_lower:
-                return True
-            count = text_lower.count(loc)
-            location_hits += count
-            if count > 1:
-                return True
-        first_chunk = text_lower[:200]
-        for location in HARYANA_LOCATIONS:
-            if location.lower() in first_chunk:
-                return True
-        return False
+        analyzed = analyze_text(full_text)
+        first_hit = analyzed.first_location
+        if not first_hit:
+            return False
+        
+        # The title and first-200-characters checks only need the first mention
+        if analyzed.text.startswith(title):
+            # Title is the start of the text, so a title mention is the first hit
+            in_title = first_hit[2] <= len(title)
+        else:
+            in_title = analyze_text(title).first_location is not None
+        if in_title:
+            return True
+        
+        # Mentioned within the first 200 characters
+        if first_hit[2] <= 200:
+            return True
+        
+        # Only now is the whole article scanned, for a repeated mention
+        counts = Counter(location for location, _, _ in analyzed.locations)
+        return any(count > 1 for count in counts.values())
 
 def main():
     """Main function for testing"""
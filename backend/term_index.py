@@ -0,0 +1,105 @@
+"""
+Inverted index from preset keywords to article ids
+Posting lists are stored in the article_terms table, written when articles are
+saved or rescored and removed when they are deleted, so preset lookups can fetch
+only the articles that match at least one of the preset's keywords.
+"""
+
+import logging
+from typing import AbstractSet, Dict, List
+
+from sqlalchemy.orm import Session
+
+from main import Article, ArticleTerm, SessionLocal
+from haryana_config import HARYANA_FILTER_PRESETS, analyze_text
+
+logger = logging.getLogger(__name__)
+
+# Every preset keyword, lowercased: the terms that get posting lists
+INDEXED_TERMS = frozenset(
+    keyword.lower() for preset in HARYANA_FILTER_PRESETS.values() for keyword in preset["keywords"]
+)
+
+
+def preset_terms(preset_key: str) -> List[str]:
+    """Lowercased keywords of a preset, as stored in the index"""
+    return sorted({keyword.lower() for keyword in HARYANA_FILTER_PRESETS[preset_key]["keywords"]})
+
+
+def posting_mappings(article_id: int, found_terms: AbstractSet[str]) -> List[Dict]:
+    """
+    ArticleTerm column dicts for one article, for bulk inserts
+
+    Args:
+        article_id: Article the postings belong to
+        found_terms: Scoring vocabulary found in the article (the last of
+            AnalyzedText.scoring_terms, or a TermMatrixScorer's found_terms)
+    """
+    return [{"term": term, "article_id": article_id} for term in sorted(found_terms & INDEXED_TERMS)]
+
+
+def delete_postings(db: Session, article_ids: List[int]) -> int:
+    """Remove the given articles from every posting list (caller commits)"""
+    if not article_ids:
+        return 0
+    return db.query(ArticleTerm).filter(
+        ArticleTerm.article_id.in_(article_ids)
+    ).delete(synchronize_session=False)
+
+
+def preset_candidates(db: Session, preset_key: str):
+    """
+    Union of the posting lists of a preset's keywords
+
+    Returns:
+        Subquery of article ids, usable with Article.id.in_()
+    """
+    return db.query(ArticleTerm.article_id).filter(
+        ArticleTerm.term.in_(preset_terms(preset_key))
+    ).distinct()
+
+
+def rebuild_term_index(batch_size: int = 500) -> int:
+    """
+    Rebuild every posting list from the stored articles
+
+    Returns:
+        Number of articles indexed
+    """
+    db = SessionLocal()
+    indexed = 0
+    last_id = 0
+
+    try:
+        while True:
+            articles = db.query(Article.id, Article.title, Article.content).filter(
+                Article.id > last_id
+            ).order_by(Article.id).limit(batch_size).all()
+            if not articles:
+                break
+
+            article_ids = [article.id for article in articles]
+            delete_postings(db, article_ids)
+            postings = []
+            for article in articles:
+                _, _, found_terms = analyze_text(f"{article.title} {article.content}").scoring_terms
+                postings.extend(posting_mappings(article.id, found_terms))
+            db.bulk_insert_mappings(ArticleTerm, postings)
+            db.commit()
+
+            indexed += len(articles)
+            last_id = article_ids[-1]
+            logger.info(f"Indexed {indexed} articles")
+
+    except Exception as e:
+        logger.error(f"Error rebuilding term index: {str(e)}")
+        db.rollback()
+    finally:
+        db.close()
+
+    return indexed
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print(f"✅ Indexed {rebuild_term_index()} articles")
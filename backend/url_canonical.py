@@ -0,0 +1,97 @@
+"""
+URL canonicalization for article dedup
+The same story reaches us with tracking parameters, AMP paths, trailing
+slashes, http or https, with or without www. canonicalize_url maps those
+variants to one form (general rules plus per-domain rules for the Indian news
+sites we scrape), and url_hash turns it into the signed 64-bit value stored in
+the unique articles.url_hash column. Articles keep their original url for
+display and linking; only the hash is canonical.
+"""
+
+import hashlib
+import re
+from typing import Dict, List, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that never identify an article
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "igshid", "mc_cid", "mc_eid", "_ga",
+    "ref", "ref_src", "referrer", "cmpid", "ito", "amp", "outputtype",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+# Mobile / AMP hosts serving the same articles as the main site
+HOST_ALIASES = {
+    "m.timesofindia.com": "timesofindia.indiatimes.com",
+    "m.economictimes.com": "economictimes.indiatimes.com",
+    "m.hindustantimes.com": "hindustantimes.com",
+    "m.tribuneindia.com": "tribuneindia.com",
+    "m.thehindu.com": "thehindu.com",
+    "amp.ndtv.com": "ndtv.com",
+    "m.ndtv.com": "ndtv.com",
+}
+
+# Per-domain path rewrites (pattern, replacement), applied after the general rules
+PATH_REWRITES: Dict[str, List[Tuple[re.Pattern, str]]] = {
+    "timesofindia.indiatimes.com": [(re.compile(r"/amp_articleshow/"), "/articleshow/")],
+    "economictimes.indiatimes.com": [(re.compile(r"/amp_articleshow/"), "/articleshow/")],
+    "indianexpress.com": [(re.compile(r"/lite$"), "")],
+    "livemint.com": [(re.compile(r"^/amp-"), "/")],
+}
+
+# Per-domain extra parameters to drop
+DOMAIN_DROP_PARAMS = {
+    "ndtv.com": {"pfrom", "akamai-rum", "browsing"},
+    "timesofindia.indiatimes.com": {"frmapp", "comment"},
+    "hindustantimes.com": {"hts"},
+}
+
+AMP_SEGMENT = "amp"
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Canonical form of an article URL
+
+    Args:
+        url: URL as found in a feed
+
+    Returns:
+        https URL with lowercased host (no www., no default port, mobile hosts
+        aliased), no AMP segments, no trailing slash, no fragment, and only
+        non-tracking query parameters in sorted order. Non-http URLs are
+        returned stripped but otherwise unchanged.
+    """
+    url = (url or "").strip()
+    parts = urlsplit(url)
+    if parts.scheme.lower() not in ("http", "https") or not parts.hostname:
+        return url
+
+    host = parts.hostname.rstrip(".")
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    host = host.removeprefix("www.")
+    host = HOST_ALIASES.get(host, host)
+
+    # Drop empty and "amp" path segments (/amp/story, /story/amp)
+    segments = [segment for segment in parts.path.split("/") if segment and segment.lower() != AMP_SEGMENT]
+    path = "/" + "/".join(segments)
+    for pattern, replacement in PATH_REWRITES.get(host, []):
+        path = pattern.sub(replacement, path) or "/"
+
+    drop = DOMAIN_DROP_PARAMS.get(host, set())
+    params = sorted(
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name.lower() not in TRACKING_PARAMS and name.lower() not in drop and not name.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit(("https", host, path, urlencode(params), ""))
+
+
+def url_fingerprint(url: str) -> int:
+    """Signed 64-bit hash of a string (fits BIGINT / SQLite INTEGER)"""
+    return int.from_bytes(hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest(), "big", signed=True)
+
+
+def url_hash(url: str) -> int:
+    """articles.url_hash value for a URL: fingerprint of its canonical form"""
+    return url_fingerprint(canonicalize_url(url))
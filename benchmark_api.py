@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark for the API
+Seeds a throwaway SQLite database with a synthetic Haryana corpus, starts the
+API under uvicorn and fires parallel requests at the list endpoints. Reports
+throughput and latency percentiles, plus how much slow /haryana/articles calls
+delay cheap requests running alongside them (a blocked event loop shows up as a
+large stall).
+
+Usage:
+    python3 benchmark_api.py                          # 5k articles, 16 clients
+    python3 benchmark_api.py --concurrency 64 --requests 2000
+    python3 benchmark_api.py --json results.json
+"""
+
+import os
+import sys
+import json
+import subprocess
+import tempfile
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import requests
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend')
+
+WORKLOAD = [
+    "/haryana/articles?limit=100",
+    "/haryana/articles?filter_preset=infrastructure&limit=50",
+    "/articles?limit=50",
+    "/search?q=road&limit=20",
+    "/sources",
+    "/scrape/status",
+]
+SLOW_REQUEST = "/haryana/articles?limit=2000&max_scan=5000"
+FAST_REQUEST = "/sources"
+
+
+def seed_database(db_path, num_articles, seed):
+    """Fill a fresh SQLite database with scored synthetic articles"""
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    sys.path.append(BACKEND_DIR)
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+    from main import SessionLocal, Article, Source
+    from article_scores import backfill_article_scores
+    from benchmark_scoring import generate_corpus
+
+    db = SessionLocal()
+    try:
+        db.add(Source(name="Benchmark Source", url="https://example.com", rss_feed="https://example.com/rss"))
+        now = datetime.utcnow()
+        for i, (title, content) in enumerate(generate_corpus(num_articles, seed)):
+            db.add(Article(
+                source_id=1, title=title, content=content, url=f"https://example.com/{i}",
+                published_at=now - timedelta(minutes=i),
+            ))
+        db.commit()
+    finally:
+        db.close()
+    backfill_article_scores()
+
+
+def start_server(db_path, port):
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{db_path}", RESPONSE_CACHE_SIZE="0")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            requests.get(base_url + "/", timeout=1)
+            return server, base_url
+        except requests.RequestException:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("API server did not start")
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def latency_summary(name, latencies, elapsed=None):
+    values = sorted(latencies)
+    summary = {
+        "name": name,
+        "requests": len(values),
+        "p50_ms": round(percentile(values, 0.50) * 1000, 1),
+        "p90_ms": round(percentile(values, 0.90) * 1000, 1),
+        "p99_ms": round(percentile(values, 0.99) * 1000, 1),
+        "max_ms": round(values[-1] * 1000, 1) if values else 0.0,
+    }
+    if elapsed:
+        summary["requests_per_sec"] = round(len(values) / elapsed, 1)
+    return summary
+
+
+def run_throughput(base_url, concurrency, total_requests):
+    """Mixed workload from concurrent clients"""
+    local = threading.local()
+
+    def call(i):
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+        started = time.perf_counter()
+        local.session.get(base_url + WORKLOAD[i % len(WORKLOAD)]).raise_for_status()
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = list(executor.map(call, range(total_requests)))
+    return latency_summary(f"mixed workload x{concurrency}", latencies, time.perf_counter() - started)
+
+
+def run_stall(base_url, slow_clients, fast_requests):
+    """Latency of a cheap endpoint while slow requests are in flight"""
+    session = requests.Session()
+    idle = []
+    for _ in range(fast_requests):
+        started = time.perf_counter()
+        session.get(base_url + FAST_REQUEST).raise_for_status()
+        idle.append(time.perf_counter() - started)
+
+    stop = threading.Event()
+
+    def slow_client():
+        with requests.Session() as slow_session:
+            while not stop.is_set():
+                slow_session.get(base_url + SLOW_REQUEST).raise_for_status()
+
+    threads = [threading.Thread(target=slow_client) for _ in range(slow_clients)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.5)
+    loaded = []
+    try:
+        for _ in range(fast_requests):
+            started = time.perf_counter()
+            session.get(base_url + FAST_REQUEST).raise_for_status()
+            loaded.append(time.perf_counter() - started)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    return [
+        latency_summary(f"{FAST_REQUEST} idle", idle),
+        latency_summary(f"{FAST_REQUEST} beside {slow_clients} slow calls", loaded),
+    ]
+
+
+def print_results(results):
+    print(f"\n{'Scenario':<44} {'req/s':>8} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    print("-" * 92)
+    for result in results:
+        rate = f"{result['requests_per_sec']:,.0f}" if "requests_per_sec" in result else "-"
+        print(
+            f"{result['name']:<44} {rate:>8} {result['p50_ms']:>9.1f} "
+            f"{result['p90_ms']:>9.1f} {result['p99_ms']:>9.1f} {result['max_ms']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark API throughput under parallel requests')
+    parser.add_argument('--articles', type=int, default=5000,
+                        help='Number of synthetic articles (default: 5000)')
+    parser.add_argument('--seed', type=int, default=42,
+                        help='Corpus random seed (default: 42)')
+    parser.add_argument('--concurrency', type=int, default=16,
+                        help='Parallel clients (default: 16)')
+    parser.add_argument('--requests', type=int, default=400,
+                        help='Requests in the mixed workload (default: 400)')
+    parser.add_argument('--slow-clients', type=int, default=4,
+                        help='Clients issuing slow requests in the stall test (default: 4)')
+    parser.add_argument('--port', type=int, default=8765,
+                        help='Port for the benchmark server (default: 8765)')
+    parser.add_argument('--json', metavar='PATH',
+                        help='Also write results to a JSON file')
+
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "benchmark.db")
+        print(f"\n⏱️  API benchmark - {args.articles:,} articles, {args.concurrency} clients\n")
+        print("🌱 Seeding database...")
+        seed_database(db_path, args.articles, args.seed)
+
+        print("🚀 Starting API server (response cache disabled)...")
+        server, base_url = start_server(db_path, args.port)
+        try:
+            results = [run_throughput(base_url, args.concurrency, args.requests)]
+            results.extend(run_stall(base_url, args.slow_clients, fast_requests=50))
+        finally:
+            server.terminate()
+            server.wait()
+
+    print_results(results)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                "timestamp": datetime.now().isoformat(),
+                "articles": args.articles,
+                "concurrency": args.concurrency,
+                "results": results,
+            }, f, indent=2)
+        print(f"\n💾 Results written to {args.json}")
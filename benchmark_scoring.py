@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for the article scoring hot path
+Generates a reproducible synthetic Haryana corpus and reports throughput and
+per-call latency percentiles, so scoring engine changes can be compared on the
+same numbers.
+
+Usage:
+    python3 benchmark_scoring.py                      # 10k articles
+    python3 benchmark_scoring.py --articles 1000000   # full-size run
+    python3 benchmark_scoring.py --no-cache --json results.json
+"""
+
+import os
+import sys
+import json
+import random
+import time
+from datetime import datetime
+
+# Never touch the real database: the imported modules create tables on import
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+# Add backend directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+import haryana_config
+from haryana_config import (
+    HARYANA_FILTER_PRESETS,
+    HARYANA_LOCATIONS,
+    VIOLENT_KEYWORDS,
+    calculate_relevance_score,
+    is_article_positive,
+    is_haryana_relevant,
+)
+from scraper import NewsScraper
+from add_haryana_test_data import SAMPLE_ARTICLES
+
+FILLER_WORDS = [
+    "the", "state", "officials", "said", "on", "monday", "district", "residents",
+    "according", "to", "a", "statement", "issued", "by", "department", "local",
+    "authorities", "and", "people", "in", "this", "year", "city", "of", "will",
+]
+
+NON_HARYANA_PLACES = ["Mumbai", "Bengaluru", "Chennai", "Kolkata", "Jaipur", "Lucknow", "Raipur"]
+
+
+def generate_corpus(num_articles, seed=42):
+    """
+    Yield (title, content) pairs for a reproducible synthetic corpus
+
+    Each article starts from a sample template in add_haryana_test_data.py
+    and mixes in preset vocabulary, locations and the occasional negative
+    or violent term, so every branch of the scorers is exercised.
+    """
+    rng = random.Random(seed)
+    vocabulary = []
+    for preset in HARYANA_FILTER_PRESETS.values():
+        vocabulary.extend(preset["keywords"])
+        vocabulary.extend(preset["positive_indicators"])
+    negatives = [term for preset in HARYANA_FILTER_PRESETS.values() for term in preset["negative_indicators"]]
+
+    for _ in range(num_articles):
+        template = rng.choice(SAMPLE_ARTICLES)
+        place = rng.choice(HARYANA_LOCATIONS if rng.random() < 0.8 else NON_HARYANA_PLACES)
+        title = f"{template['title']} {place}"
+
+        words = []
+        for _ in range(rng.randint(60, 600)):
+            roll = rng.random()
+            if roll < 0.08:
+                words.append(rng.choice(vocabulary))
+            elif roll < 0.09:
+                words.append(rng.choice(negatives))
+            elif roll < 0.095:
+                words.append(rng.choice(HARYANA_LOCATIONS))
+            else:
+                words.append(rng.choice(FILLER_WORDS))
+        if rng.random() < 0.05:
+            # Crime story: violent terms in the title
+            title = f"{rng.choice(VIOLENT_KEYWORDS).capitalize()} reported in {place}"
+
+        content = f"{template['content']} {' '.join(words)}."
+        yield title, content
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(name, timings_ns, articles, elapsed):
+    timings = sorted(timings_ns)
+    return {
+        "function": name,
+        "articles": articles,
+        "calls": len(timings),
+        "articles_per_sec": round(articles / elapsed, 1) if elapsed else 0.0,
+        "p50_us": round(percentile(timings, 0.50) / 1000, 2),
+        "p90_us": round(percentile(timings, 0.90) / 1000, 2),
+        "p99_us": round(percentile(timings, 0.99) / 1000, 2),
+        "max_us": round(timings[-1] / 1000, 2) if timings else 0.0,
+    }
+
+
+def run_benchmark(num_articles=10000, seed=42, use_cache=True):
+    """
+    Time each scoring function over the same synthetic corpus
+
+    Args:
+        num_articles: Corpus size
+        seed: Corpus random seed
+        use_cache: If False, clear the per-text analysis cache before every
+            call so each call pays for the full scan
+
+    Returns:
+        list of per-function result dicts
+    """
+    scraper = NewsScraper()
+    preset_keys = list(HARYANA_FILTER_PRESETS.keys())
+
+    def reset():
+        if not use_cache:
+            haryana_config._analyze_str.cache_clear()
+
+    benchmarks = {
+        # Scored against every preset, the way the API and scraper call it
+        "calculate_relevance_score": lambda title, content, text: [
+            (reset(), calculate_relevance_score(text, key)) for key in preset_keys
+        ],
+        "is_haryana_relevant": lambda title, content, text: (reset(), is_haryana_relevant(text)),
+        "is_article_positive": lambda title, content, text: (reset(), is_article_positive(text)),
+        "NewsScraper._calculate_positivity_score": lambda title, content, text: (
+            reset(), scraper._calculate_positivity_score(title, content)
+        ),
+    }
+
+    results = []
+    for name, call in benchmarks.items():
+        haryana_config._analyze_str.cache_clear()
+        timings = []
+        perf_counter_ns = time.perf_counter_ns
+        started = time.perf_counter()
+        for title, content in generate_corpus(num_articles, seed):
+            text = f"{title} {content}"
+            before = perf_counter_ns()
+            call(title, content, text)
+            timings.append(perf_counter_ns() - before)
+        elapsed = sum(timings) / 1e9
+        results.append(summarize(name, timings, num_articles, elapsed))
+        print(f"   ✓ {name} ({time.perf_counter() - started:.1f}s)")
+    return results
+
+
+def print_results(results):
+    print(f"\n{'Function':<42} {'articles/s':>12} {'p50 µs':>10} {'p90 µs':>10} {'p99 µs':>10} {'max µs':>10}")
+    print("-" * 98)
+    for result in results:
+        print(
+            f"{result['function']:<42} {result['articles_per_sec']:>12,.0f} "
+            f"{result['p50_us']:>10.1f} {result['p90_us']:>10.1f} "
+            f"{result['p99_us']:>10.1f} {result['max_us']:>10.1f}"
+        )
+    print("\nLatency is per article; calculate_relevance_score covers all presets.")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Benchmark the article scoring hot path')
+    parser.add_argument('--articles', type=int, default=10000,
+                        help='Number of synthetic articles (default: 10000)')
+    parser.add_argument('--seed', type=int, default=42,
+                        help='Corpus random seed (default: 42)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Clear the per-text analysis cache before every call')
+    parser.add_argument('--json', metavar='PATH',
+                        help='Also write results to a JSON file')
+
+    args = parser.parse_args()
+
+    print(f"\n⏱️  Scoring benchmark - {args.articles:,} articles, seed {args.seed}"
+          f"{', cache disabled' if args.no_cache else ''}\n")
+    results = run_benchmark(num_articles=args.articles, seed=args.seed, use_cache=not args.no_cache)
+    print_results(results)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                "timestamp": datetime.now().isoformat(),
+                "articles": args.articles,
+                "seed": args.seed,
+                "cache": not args.no_cache,
+                "results": results,
+            }, f, indent=2)
+        print(f"\n💾 Results written to {args.json}")
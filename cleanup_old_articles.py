@@ -8,7 +8,10 @@ from datetime import datetime, timedelta
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
 
-from main import SessionLocal, Article, Post
+from main import SessionLocal, Article, Post, bump_ingest_generation
+from article_scores import delete_article_scores
+from term_index import delete_postings
+from ingest_stats import rebuild_ingest_stats
 
 def cleanup_articles(delete_all=False, days_to_keep=0, delete_posts=False):
     """
@@ -67,10 +70,15 @@ def cleanup_articles(delete_all=False, days_to_keep=0, delete_posts=False):
                 db.commit()
                 print("✅ Posts deleted")
         
-        # Delete articles
+        # Delete articles with their stored scores and index postings
         print(f"\nDeleting {len(articles_to_delete)} articles...")
+        delete_article_scores(db, article_ids)
+        delete_postings(db, article_ids)
         for article in articles_to_delete:
             db.delete(article)
+        db.flush()
+        rebuild_ingest_stats(db)
+        bump_ingest_generation(db)
         db.commit()
         
         # Count after deletion
@@ -1,6 +1,6 @@
-import React, { useState } from 'react';
-import { useQuery, useMutation } from '@tanstack/react-query';
-import api, { ArticleWithScore, TweetPreview } from '../services/api';
+import React, { useEffect, useState } from 'react';
+import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import api, { ArticleWithScore, ScrapeJob, TweetPreview } from '../services/api';
 import { 
   SparklesIcon,
   ArrowTopRightOnSquareIcon,
@@ -26,6 +26,9 @@ const HaryanaNews: React.FC = () => {
   const [usePremium, setUsePremium] = useState<boolean>(true);
   const [scrapeSuccess, setScrapeSuccess] = useState<string>('');
   const [scrapeError, setScrapeError] = useState<string>('');
+  const [scrapeJob, setScrapeJob] = useState<ScrapeJob | null>(null);
+  const [newArticleCount, setNewArticleCount] = useState<number>(0);
+  const queryClient = useQueryClient();
 
   const { data: articles, isLoading: articlesLoading } = useQuery({
     queryKey: ['haryana-articles', selectedSentiment, minScore],
@@ -36,6 +39,25 @@ const HaryanaNews: React.FC = () => {
     })
   });
 
+  // Count articles pushed by the server instead of polling the list
+  useEffect(() => {
+    setNewArticleCount(0);
+    return api.subscribeToArticles(
+      { min_score: minScore },
+      (article) => {
+        if (!selectedSentiment || article.sentiment === selectedSentiment) {
+          setNewArticleCount((count) => count + 1);
+        }
+      },
+      () => queryClient.invalidateQueries({ queryKey: ['haryana-articles'] })
+    );
+  }, [minScore, selectedSentiment, queryClient]);
+
+  const showNewArticles = () => {
+    setNewArticleCount(0);
+    queryClient.invalidateQueries({ queryKey: ['haryana-articles'] });
+  };
+
   const { data: twitterStatus } = useQuery({
     queryKey: ['twitter-status'],
     queryFn: api.getTwitterStatus
@@ -71,8 +93,14 @@ const HaryanaNews: React.FC = () => {
 
   // Manual scraping mutation
   const scrapeMutation = useMutation({
-    mutationFn: api.triggerScraping,
+    mutationFn: () => api.triggerScraping(setScrapeJob),
     onSuccess: (data) => {
+      setScrapeJob(null);
+      if (!data.success) {
+        setScrapeError(data.results.errors[data.results.errors.length - 1] || 'Scraping failed');
+        setScrapeSuccess('');
+        return;
+      }
       const { results } = data;
       setScrapeSuccess(
         `Scraping complete! Found ${results.articles_found} articles, ${results.new_articles} new. Refresh page to see updates.`
@@ -84,6 +112,7 @@ const HaryanaNews: React.FC = () => {
       }, 3000);
     },
     onError: (error: any) => {
+      setScrapeJob(null);
       setScrapeError(error.response?.data?.detail || 'Failed to trigger scraping');
       setScrapeSuccess('');
     }
@@ -170,11 +199,25 @@ const HaryanaNews: React.FC = () => {
               title="Manually trigger news scraping from all sources"
             >
               <ArrowPathIcon className={`h-5 w-5 mr-2 ${scrapeMutation.isPending ? 'animate-spin' : ''}`} />
-              {scrapeMutation.isPending ? 'Scraping...' : 'Scrape Now'}
+              {scrapeMutation.isPending
+                ? scrapeJob && scrapeJob.sources_total > 0
+                  ? `Scraping ${scrapeJob.sources_done}/${scrapeJob.sources_total}...`
+                  : 'Scraping...'
+                : 'Scrape Now'}
             </button>
           </div>
         </div>
 
+        {/* New Articles Banner */}
+        {newArticleCount > 0 && (
+          <button
+            onClick={showNewArticles}
+            className="mt-4 w-full p-3 bg-blue-50 border border-blue-200 rounded-lg text-blue-800 hover:bg-blue-100 transition-colors"
+          >
+            {newArticleCount} new {newArticleCount === 1 ? 'article' : 'articles'} - click to show
+          </button>
+        )}
+
         {/* Scraping Success Message */}
         {scrapeSuccess && (
           <div className="mt-4 p-4 bg-green-50 border border-green-200 rounded-lg">
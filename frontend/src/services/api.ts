@@ -30,6 +30,19 @@ export interface ArticleWithScore extends Article {
   negative_matches?: string[];
 }
 
+export interface StreamedArticle {
+  id: number;
+  source_id: number;
+  title: string;
+  url: string;
+  published_at: string | null;
+  crawled_at: string | null;
+  summary: string | null;
+  relevance_score: number;
+  sentiment: string;
+  category: string;
+}
+
 export interface HaryanaFilterPreset {
   name: string;
   description: string;
@@ -100,6 +113,31 @@ export interface ScrapeResponse {
   results: ScrapeResults;
 }
 
+export interface ScrapeSourceProgress {
+  source_id: number;
+  source: string;
+  articles_found: number;
+  new_articles: number;
+  not_modified: boolean;
+  error: string | null;
+}
+
+export interface ScrapeJob {
+  id: number;
+  status: 'queued' | 'running' | 'completed' | 'failed';
+  sources_total: number;
+  sources_done: number;
+  articles_found: number;
+  new_articles: number;
+  sources: ScrapeSourceProgress[];
+  errors: string[];
+  created_at: string;
+  started_at: string | null;
+  updated_at: string;
+  finished_at: string | null;
+  results: ScrapeResults;
+}
+
 export interface ScrapeStatus {
   total_articles: number;
   last_24h: number;
@@ -127,8 +165,14 @@ interface ExtendedAxiosInstance extends AxiosInstance {
   getTwitterStatus: () => Promise<TwitterStatus>;
   previewTweet: (request: TweetRequest) => Promise<TweetPreview>;
   postToTwitter: (request: TweetRequest) => Promise<TweetResponse>;
-  triggerScraping: () => Promise<ScrapeResponse>;
+  triggerScraping: (onProgress?: (job: ScrapeJob) => void) => Promise<ScrapeResponse>;
+  getScrapeJob: (jobId: number) => Promise<ScrapeJob>;
   getScrapeStatus: () => Promise<ScrapeStatus>;
+  subscribeToArticles: (
+    params: { filter_preset?: string; min_score?: number },
+    onArticle: (article: StreamedArticle) => void,
+    onDropped?: () => void
+  ) => () => void;
 }
 
 const api = axios.create({
@@ -157,6 +201,9 @@ export const getArticles = async (params?: {
   date_to?: string;
   limit?: number;
   offset?: number;
+  cursor?: string;
+  fields?: string;
+  view?: 'full' | 'summary';
 }): Promise<Article[]> => {
   const response = await api.get('/articles', { params });
   return response.data;
@@ -167,6 +214,7 @@ export const searchArticles = async (params: {
   source_id?: number;
   limit?: number;
   offset?: number;
+  cursor?: string;
 }): Promise<Article[]> => {
   const response = await api.get('/search', { params });
   return response.data;
@@ -205,6 +253,9 @@ export const getHaryanaArticles = async (params: {
   min_score?: number;
   limit?: number;
   offset?: number;
+  cursor?: string;
+  fields?: string;
+  view?: 'full' | 'summary';
 }): Promise<ArticleWithScore[]> => {
   const response = await api.get('/haryana/articles', { params });
   return response.data;
@@ -237,16 +288,53 @@ export const postToTwitter = async (request: TweetRequest): Promise<TweetRespons
 };
 
 // Scraping functions
-export const triggerScraping = async (): Promise<ScrapeResponse> => {
-  const response = await api.post('/scrape/trigger');
+const SCRAPE_POLL_INTERVAL_MS = 2000;
+
+export const getScrapeJob = async (jobId: number): Promise<ScrapeJob> => {
+  const response = await api.get(`/scrape/jobs/${jobId}`);
   return response.data;
 };
 
+// Starts a background scrape job and polls it until it finishes
+export const triggerScraping = async (onProgress?: (job: ScrapeJob) => void): Promise<ScrapeResponse> => {
+  const response = await api.post('/scrape/trigger');
+  let job: ScrapeJob = response.data.job;
+  onProgress?.(job);
+  while (job.status === 'queued' || job.status === 'running') {
+    await new Promise((resolve) => setTimeout(resolve, SCRAPE_POLL_INTERVAL_MS));
+    job = await getScrapeJob(job.id);
+    onProgress?.(job);
+  }
+  return {
+    success: job.status === 'completed',
+    message: job.status === 'completed' ? 'Scraping completed successfully' : 'Scraping failed',
+    results: job.results,
+  };
+};
+
 export const getScrapeStatus = async (): Promise<ScrapeStatus> => {
   const response = await api.get('/scrape/status');
   return response.data;
 };
 
+// Live updates: Server-Sent Events for newly saved articles; returns an unsubscribe function
+export const subscribeToArticles = (
+  params: { filter_preset?: string; min_score?: number },
+  onArticle: (article: StreamedArticle) => void,
+  onDropped?: () => void
+): (() => void) => {
+  const query = new URLSearchParams();
+  if (params.filter_preset) query.set('filter_preset', params.filter_preset);
+  if (params.min_score) query.set('min_score', String(params.min_score));
+  const source = new EventSource(`${API_BASE_URL}/stream/articles?${query.toString()}`);
+  source.addEventListener('article', (event) => {
+    onArticle(JSON.parse((event as MessageEvent).data));
+  });
+  // The server ends the stream for clients that fall behind; EventSource reconnects by itself
+  source.addEventListener('dropped', () => onDropped?.());
+  return () => source.close();
+};
+
 // Export API functions as methods on the api object
 api.getSources = getSources;
 api.createSource = createSource;
@@ -263,6 +351,8 @@ api.getTwitterStatus = getTwitterStatus;
 api.previewTweet = previewTweet;
 api.postToTwitter = postToTwitter;
 api.triggerScraping = triggerScraping;
+api.getScrapeJob = getScrapeJob;
 api.getScrapeStatus = getScrapeStatus;
+api.subscribeToArticles = subscribeToArticles;
 
 export default api;
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Bulk rescoring of the article archive across all CPU cores
+Streams articles from the database in id-ordered chunks, scores them in a
+process pool and writes the per-preset scores and index postings back with bulk
+inserts. Memory stays bounded by the chunk size and number of chunks in flight.
+
+Usage:
+    python3 rescore.py                       # rescore every article
+    python3 rescore.py --stale-only          # only articles scored under an older config
+    python3 rescore.py --workers 4 --chunk-size 2000
+"""
+
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+# Add backend directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
+
+from main import SessionLocal, Article, ArticleScore, ArticleTerm, bump_ingest_generation
+from haryana_config import score_articles_batch, scoring_fingerprint
+from article_scores import score_mappings
+from term_index import delete_postings, posting_mappings
+
+
+def stream_chunks(chunk_size, stale_only=False):
+    """
+    Yield lists of (id, title, content) in id order
+
+    Each chunk is its own keyset query (id > last id), so no cursor stays
+    open while results are written back and no chunk is read twice.
+    """
+    from rescore_job import stale_articles_query
+
+    db = SessionLocal()
+    config_hash = scoring_fingerprint()
+    last_id = 0
+    try:
+        while True:
+            query = stale_articles_query(db, config_hash) if stale_only else db.query(Article)
+            rows = query.with_entities(Article.id, Article.title, Article.content).filter(
+                Article.id > last_id
+            ).order_by(Article.id).limit(chunk_size).all()
+            db.rollback()  # End the read transaction before the chunk is written back
+            if not rows:
+                break
+            last_id = rows[-1].id
+            yield [tuple(row) for row in rows]
+    finally:
+        db.close()
+
+
+def write_chunk(scored, config_hash):
+    """Replace the stored scores and postings of one scored chunk"""
+    db = SessionLocal()
+    try:
+        article_ids = [article_id for article_id, _, _, _ in scored]
+        score_rows = []
+        postings = []
+        for article_id, all_scores, relevant, found_terms in scored:
+            score_rows.extend(score_mappings(
+                article_id, all_scores["results"], all_scores["best_preset"], relevant, config_hash
+            ))
+            postings.extend(posting_mappings(article_id, found_terms))
+
+        db.query(ArticleScore).filter(
+            ArticleScore.article_id.in_(article_ids)
+        ).delete(synchronize_session=False)
+        delete_postings(db, article_ids)
+        db.bulk_insert_mappings(ArticleScore, score_rows)
+        db.bulk_insert_mappings(ArticleTerm, postings)
+        bump_ingest_generation(db)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def rescore(workers=None, chunk_size=1000, stale_only=False, verbose=True):
+    """
+    Rescore articles in parallel
+
+    Args:
+        workers: Worker processes (default: CPU count)
+        chunk_size: Articles per chunk sent to a worker
+        stale_only: Only rescore articles without scores for the current config
+        verbose: Print progress
+
+    Returns:
+        dict: Rescoring results
+    """
+    workers = workers or os.cpu_count() or 1
+    config_hash = scoring_fingerprint()
+    results = {
+        'timestamp': datetime.now().isoformat(),
+        'config_hash': config_hash,
+        'articles': 0,
+        'relevant': 0,
+        'chunks': 0,
+        'errors': []
+    }
+    started = time.perf_counter()
+
+    if verbose:
+        print(f"\n{'='*70}")
+        print(f"🔁 RESCORING {'STALE ' if stale_only else ''}ARTICLES - {workers} workers, chunks of {chunk_size}")
+        print(f"{'='*70}\n")
+
+    def collect(future):
+        scored = future.result()
+        write_chunk(scored, config_hash)
+        results['chunks'] += 1
+        results['articles'] += len(scored)
+        results['relevant'] += sum(1 for _, _, relevant, _ in scored if relevant)
+        if verbose:
+            rate = results['articles'] / (time.perf_counter() - started)
+            print(f"   ✓ {results['articles']:,} articles ({rate:,.0f}/s)")
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Bounded number of chunks in flight keeps memory flat on large archives
+        in_flight = deque()
+        try:
+            for chunk in stream_chunks(chunk_size, stale_only):
+                in_flight.append(executor.submit(score_articles_batch, chunk))
+                if len(in_flight) >= workers * 2:
+                    collect(in_flight.popleft())
+            while in_flight:
+                collect(in_flight.popleft())
+        except Exception as e:
+            results['errors'].append(str(e))
+            for future in in_flight:
+                future.cancel()
+            if verbose:
+                print(f"\n❌ Error during rescoring: {str(e)}")
+
+    results['seconds'] = round(time.perf_counter() - started, 2)
+    if verbose:
+        print(f"\n✅ Rescored {results['articles']:,} articles in {results['seconds']}s")
+        print(f"🎯 Haryana-relevant: {results['relevant']:,}")
+        print(f"{'='*70}\n")
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Rescore the article archive in parallel')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: number of CPUs)')
+    parser.add_argument('--chunk-size', type=int, default=1000,
+                        help='Articles per chunk (default: 1000)')
+    parser.add_argument('--stale-only', action='store_true',
+                        help='Only rescore articles scored under an older scoring config')
+    parser.add_argument('--quiet', action='store_true',
+                        help='Suppress detailed output')
+
+    args = parser.parse_args()
+    rescore(workers=args.workers, chunk_size=args.chunk_size,
+            stale_only=args.stale_only, verbose=not args.quiet)
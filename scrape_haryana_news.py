@@ -10,7 +10,7 @@ from datetime import datetime
 sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
 
 from scraper import NewsScraper
-from main import SessionLocal, Source, Article
+from main import SessionLocal, Source, Article, ArticleScore
 
 def scrape_haryana_news():
     """Scrape news from Haryana-specific sources"""
@@ -75,15 +75,13 @@ def scrape_haryana_news():
         
         # Get database statistics
         total_db_articles = db.query(Article).count()
-        haryana_relevant = 0
         
-        # Count Haryana-relevant articles
-        from haryana_config import is_haryana_relevant
-        all_articles = db.query(Article).all()
-        for article in all_articles:
-            article_text = f"{article.title} {article.content}"
-            if is_haryana_relevant(article_text):
-                haryana_relevant += 1
+        # Count Haryana-relevant articles from the scores stored at ingest
+        # (run rescore.py to (re)score articles added by other means)
+        haryana_relevant = db.query(ArticleScore).filter(
+            ArticleScore.is_best == True,
+            ArticleScore.is_relevant == True
+        ).count()
         
         print(f"\n✅ Total articles fetched: {total_articles}")
         print(f"✅ New articles saved: {total_new}")